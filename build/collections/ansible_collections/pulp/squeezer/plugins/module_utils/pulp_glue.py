@@ -0,0 +1,381 @@
+# copyright (c) 2022, Matthias Dellweg
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+import time
+import traceback
+
+from ansible.module_utils.basic import AnsibleModule, env_fallback, missing_required_lib
+from ansible_collections.pulp.squeezer.plugins.module_utils.instrumentation import (
+    Hooks,
+    RequestStats,
+)
+
+try:
+    from packaging.requirements import SpecifierSet
+    from pulp_glue.common import __version__ as pulp_glue_version
+    from pulp_glue.common.context import PulpContext, PulpException, PulpNoWait
+    from pulp_glue.common.openapi import BasicAuthProvider
+
+    GLUE_VERSION_SPEC = ">=0.29.2,<0.31"
+    if not SpecifierSet(GLUE_VERSION_SPEC, prereleases=True).contains(pulp_glue_version):
+        raise ImportError(
+            f"Installed 'pulp-glue' version '{pulp_glue_version}' is not in '{GLUE_VERSION_SPEC}'."
+        )
+
+    PULP_CLI_IMPORT_ERR = None
+except ImportError:
+    PULP_CLI_IMPORT_ERR = traceback.format_exc()
+
+
+class SqueezerException(Exception):
+    pass
+
+
+if PULP_CLI_IMPORT_ERR is None:
+
+    class SqueezerPulpContext(PulpContext):
+        """PulpContext reporting its requests and task waits to instrumentation hooks."""
+
+        def __init__(self, *args, hooks, **kwargs):
+            self.hooks = hooks
+            super().__init__(*args, **kwargs)
+
+        @property
+        def api(self):
+            if self._api is None:
+                self._instrument(super().api)
+            return self._api
+
+        def _instrument(self, api):
+            hooks = self.hooks
+            status = {}
+
+            def _count_bytes(response, *args, **kwargs):
+                if response.request.body is not None:
+                    hooks.fire("bytes_sent", len(response.request.body))
+                content = response.content
+                # Like the legacy client, count the bytes on the wire, before decompression.
+                tell = getattr(response.raw, "tell", None)
+                hooks.fire("bytes_received", tell() if tell is not None else len(content))
+                status["code"] = response.status_code
+
+            api._session.hooks["response"].append(_count_bytes)
+            call = api.call
+
+            def _call(operation_id, *args, **kwargs):
+                method = api.operations[operation_id][0]
+                hooks.fire("request_start", operation_id, method)
+                status.clear()
+                started = time.time()
+                try:
+                    return call(operation_id, *args, **kwargs)
+                finally:
+                    hooks.fire(
+                        "request_end",
+                        operation_id,
+                        method,
+                        status.get("code"),
+                        time.time() - started,
+                    )
+
+            api.call = _call
+
+        def wait_for_task(self, *args, **kwargs):
+            started = time.time()
+            try:
+                return super().wait_for_task(*args, **kwargs)
+            finally:
+                self.hooks.fire("task_wait", time.time() - started)
+
+        def wait_for_task_group(self, *args, **kwargs):
+            started = time.time()
+            try:
+                return super().wait_for_task_group(*args, **kwargs)
+            finally:
+                self.hooks.fire("task_wait", time.time() - started)
+
+
+__VERSION__ = "0.0.20-dev"
+
+
+class PulpAnsibleModule(AnsibleModule):
+    def __init__(self, **kwargs):
+        argument_spec = {
+            "pulp_url": {"required": True, "fallback": (env_fallback, ["SQUEEZER_PULP_URL"])},
+            "username": {"required": False, "fallback": (env_fallback, ["SQUEEZER_USERNAME"])},
+            "password": {
+                "required": False,
+                "no_log": True,
+                "fallback": (env_fallback, ["SQUEEZER_PASSWORD"]),
+            },
+            "user_cert": {"required": False, "no_log": True},
+            "user_key": {"required": False, "no_log": True},
+            "validate_certs": {
+                "type": "bool",
+                "default": True,
+                "fallback": (env_fallback, ["SQUEEZER_VALIDATE_CERTS"]),
+            },
+            "refresh_api_cache": {"type": "bool", "default": False},
+            "timeout": {"type": "int", "default": 10},
+            "squeezer_stats": {
+                "type": "bool",
+                "default": False,
+                "fallback": (env_fallback, ["SQUEEZER_STATS"]),
+            },
+        }
+        argument_spec.update(kwargs.pop("argument_spec", {}))
+        if not kwargs.pop("no_auth", False):
+            required_one_of = [
+                ("username", "user_cert"),
+                ("username", "user_key"),
+                ("password", "user_cert"),
+                ("password", "user_key"),
+            ]
+            required_one_of.extend(kwargs.pop("required_one_of", []))
+            kwargs["required_one_of"] = required_one_of
+        kwargs.setdefault("supports_check_mode", True)
+
+        import_errors = [("pulp-glue", PULP_CLI_IMPORT_ERR)]
+        import_errors.extend(kwargs.pop("import_errors", []))
+
+        super().__init__(
+            argument_spec=argument_spec,
+            **kwargs,
+        )
+
+        for import_error in import_errors:
+            if import_error[1] is not None:
+                self.fail_json(msg=missing_required_lib(import_error[0]), exception=import_error[1])
+
+        auth_args = {}
+        if self.params["username"]:
+            auth_args["auth_provider"] = BasicAuthProvider(
+                username=self.params["username"],
+                password=self.params["password"],
+            )
+
+        self._stats = None
+        hooks = Hooks()
+        if self.params["squeezer_stats"]:
+            self._stats = RequestStats()
+            self._stats.attach(hooks)
+
+        self.pulp_ctx = SqueezerPulpContext(
+            api_root="/pulp/",
+            api_kwargs=dict(
+                base_url=self.params["pulp_url"],
+                cert=self.params["user_cert"],
+                key=self.params["user_key"],
+                validate_certs=self.params["validate_certs"],
+                refresh_cache=self.params["refresh_api_cache"],
+                user_agent=f"Squeezer/{__VERSION__}",
+                **auth_args,
+            ),
+            background_tasks=False,
+            timeout=self.params["timeout"],
+            fake_mode=self.check_mode,  # This sets api_kwargs["safe_calls_only"] for us.
+            hooks=hooks,
+        )
+
+    def __enter__(self):
+        self._changed = False
+        self._results = {}
+        self._diff_states = []
+
+        return self
+
+    def __exit__(self, exc_class, exc_value, tb):
+        if exc_class is None:
+            if self._diff_states:
+                self._results["diff"] = {
+                    "before": self._diff_states[0],
+                    "after": self._diff_states[-1],
+                }
+            self._results.update(self._stats_results())
+            self.exit_json(changed=self._changed, **self._results)
+        else:
+            if issubclass(exc_class, (PulpException, PulpNoWait, SqueezerException)):
+                self.fail_json(msg=str(exc_value), changed=self._changed, **self._stats_results())
+                return True
+            elif issubclass(exc_class, Exception):
+                self.fail_json(
+                    msg=str(exc_value),
+                    changed=self._changed,
+                    exception="\n".join(traceback.format_exception(exc_class, exc_value, tb)),
+                    **self._stats_results(),
+                )
+                return True
+
+    def _stats_results(self):
+        # Reported on failures too, that is when the timings matter most.
+        if self._stats is None:
+            return {}
+        return {"squeezer_stats": self._stats.summary()}
+
+    def projection(self, *fields):
+        """Search parameters restricting a lookup to pulp_href and fields.
+
+        Empty unless the module offers the lookup_projection option and it is enabled.
+        """
+        if self.params.get("lookup_projection"):
+            return {"fields": ",".join(("pulp_href",) + fields)}
+        return {}
+
+    def set_changed(self):
+        self._changed = True
+
+    def set_result(self, key, value):
+        self._results[key] = value
+
+    def record_diff_state(self, value):
+        self._diff_states.append(value)
+
+
+class PulpEntityAnsibleModule(PulpAnsibleModule):
+    def __init__(self, context_class, entity_singular, entity_plural, **kwargs):
+        argument_spec = {
+            "state": {
+                "choices": ["present", "absent"],
+            },
+        }
+        argument_spec.update(kwargs.pop("argument_spec", {}))
+        super().__init__(argument_spec=argument_spec, **kwargs)
+        self.state = self.params["state"]
+
+        self.context = context_class(self.pulp_ctx)
+        self.entity_singular = entity_singular
+        self.entity_plural = entity_plural
+
+    def represent(self, entity):
+        return {
+            key: "" if (key in self.context.NULLABLES and value is None) else value
+            for key, value in entity.items()
+        }
+
+    def process(self, natural_key, desired_attributes, defaults=None):
+        if self.state is None:
+            return self.process_info(natural_key, desired_attributes)
+
+        if "pulp_href" in natural_key:
+            self.context.pulp_href = natural_key["pulp_href"]
+        else:
+            if None in natural_key.values():
+                raise SqueezerException("Insufficient information to identify the entity.")
+            self.context.entity = natural_key
+
+        if self.state == "present":
+            desired_entity = desired_attributes
+        elif self.state == "absent":
+            desired_entity = None
+        else:
+            self.set_result(
+                self.entity_singular,
+                self.process_special(desired_attributes, defaults=defaults),
+            )
+            return
+        changed, before, after = self.context.converge(desired_entity, defaults=defaults)
+        if before is not None:
+            before = self.represent(before)
+        if after is not None:
+            after = self.represent(after)
+        if changed:
+            self.set_changed()
+            self.record_diff_state(before)
+            self.record_diff_state(after)
+        self.set_result(self.entity_singular, after)
+
+    def process_info(self, natural_key, desired_attributes):
+        if any((value is not None for value in desired_attributes.values())):
+            raise SqueezerException("Cannot use attributes when querying entities.")
+        # TODO turn this into a filtering query instead
+        if None in natural_key.values():
+            entities = [
+                self.represent(entity)
+                for entity in self.context.list(limit=-1, offset=0, parameters={})
+            ]
+            self.set_result(self.entity_plural, entities)
+        else:
+            if "pulp_href" in natural_key:
+                self.context.pulp_href = natural_key["pulp_href"]
+            else:
+                self.context.entity = natural_key
+            self.set_result(self.entity_singular, self.represent(self.context.entity))
+
+    def process_special(self, entity, natural_key, desired_attributes, defaults=None):
+        raise SqueezerException(f"Invalid state '{self.state}'.")
+
+
+class PulpRemoteAnsibleModule(PulpEntityAnsibleModule):
+    def __init__(self, **kwargs):
+        argument_spec = {
+            "name": {},
+            "url": {},
+            "remote_username": {"no_log": True},
+            "remote_password": {"no_log": True},
+            "ca_cert": {},
+            "client_cert": {},
+            "client_key": {"no_log": True},
+            "tls_validation": {"type": "bool"},
+            "proxy_url": {},
+            "proxy_username": {"no_log": True},
+            "proxy_password": {"no_log": True},
+            "download_concurrency": {"type": "int"},
+            "rate_limit": {"type": "int"},
+            "total_timeout": {"type": "float"},
+            "connect_timeout": {"type": "float"},
+            "sock_connect_timeout": {"type": "float"},
+            "sock_read_timeout": {"type": "float"},
+            "max_retries": {"type": "int"},
+        }
+        argument_spec.update(kwargs.pop("argument_spec", {}))
+
+        kwargs.setdefault("entity_singular", "remote")
+        kwargs.setdefault("entity_plural", "remotes")
+
+        super().__init__(argument_spec=argument_spec, **kwargs)
+
+    def represent(self, entity):
+        result = super().represent(entity)
+        result.pop("username", None)
+        result.pop("password", None)
+        result.pop("client_key", None)
+        result.pop("proxy_username", None)
+        result.pop("proxy_password", None)
+        return result
+
+    def process(self, natural_key, desired_attributes):
+        desired_attributes.update(
+            {
+                key: self.params[key]
+                for key in [
+                    "url",
+                    "policy",
+                    "tls_validation",
+                    "proxy_url",
+                    "proxy_username",
+                    "proxy_password",
+                    "ca_cert",
+                    "client_cert",
+                    "client_key",
+                    "download_concurrency",
+                    "rate_limit",
+                    "total_timeout",
+                    "connect_timeout",
+                    "sock_connect_timeout",
+                    "sock_read_timeout",
+                    "max_retries",
+                ]
+                if self.params[key] is not None
+            }
+        )
+        if self.params["remote_username"] is not None:
+            desired_attributes["username"] = self.params["remote_username"]
+        if self.params["remote_password"] is not None:
+            desired_attributes["password"] = self.params["remote_password"]
+
+        super().process(natural_key, desired_attributes)
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+# copyright (c) 2026, Matthias Dellweg
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import re
+
+from ansible.module_utils import six
+from ansible.module_utils._text import to_native
+
+# Swagger 2.0 passes the body as parameters, they are not validated one by one.
+BODY_PARAMETER_LOCATIONS = ("body", "formData")
+SCHEMA_KEYWORDS = (
+    "type",
+    "nullable",
+    "enum",
+    "required",
+    "minLength",
+    "maxLength",
+    "minimum",
+    "maximum",
+    "pattern",
+)
+SCHEMA_TYPES = {
+    "string": six.string_types,
+    "integer": six.integer_types,
+    "number": six.integer_types + (float,),
+    "boolean": (bool,),
+    "array": (list, tuple),
+    "object": (dict,),
+}
+
+
+class ValidationError(Exception):
+    pass
+
+
+def compact_schema(schema, api_spec, resolving=()):
+    """Resolve references and keep only what validate_schema checks.
+
+    Recursive references are cut off with an empty schema, that accepts anything.
+    """
+    ref = schema.get("$ref")
+    if ref is not None:
+        if ref in resolving:
+            return {}
+        target = api_spec
+        for part in ref[2:].split("/"):
+            target = target[part]
+        return compact_schema(target, api_spec, resolving + (ref,))
+    result = dict((key, schema[key]) for key in SCHEMA_KEYWORDS if key in schema)
+    if "properties" in schema:
+        result["properties"] = dict(
+            (name, compact_schema(property_schema, api_spec, resolving))
+            for name, property_schema in schema["properties"].items()
+            if not property_schema.get("readOnly")
+        )
+    if "items" in schema:
+        result["items"] = compact_schema(schema["items"], api_spec, resolving)
+    for key in ("allOf", "anyOf", "oneOf"):
+        if key in schema:
+            result[key] = [compact_schema(entry, api_spec, resolving) for entry in schema[key]]
+    return result
+
+
+def validate_schema(schema, value, path, errors):
+    """Check value against a compacted schema, appending a message per violation to errors."""
+    if value is None:
+        if schema and not schema.get("nullable") and None not in schema.get("enum", ()):
+            errors.append("{path} must not be null".format(path=path))
+        return
+    schema_type = schema.get("type")
+    if schema_type in SCHEMA_TYPES:
+        if not isinstance(value, SCHEMA_TYPES[schema_type]) or (
+            isinstance(value, bool) and schema_type in ("integer", "number")
+        ):
+            errors.append("{path} must be of type {type}".format(path=path, type=schema_type))
+            return
+    if "enum" in schema and value not in schema["enum"]:
+        errors.append(
+            "{path} must be one of {choices}".format(
+                path=path, choices=", ".join(to_native(choice) for choice in schema["enum"])
+            )
+        )
+    if isinstance(value, six.string_types):
+        if len(value) < schema.get("minLength", 0):
+            errors.append("{path} is too short".format(path=path))
+        if "maxLength" in schema and len(value) > schema["maxLength"]:
+            errors.append("{path} is too long".format(path=path))
+        if "pattern" in schema and not re.search(schema["pattern"], value):
+            errors.append(
+                "{path} does not match '{pattern}'".format(path=path, pattern=schema["pattern"])
+            )
+    elif isinstance(value, (float,) + six.integer_types) and not isinstance(value, bool):
+        if "minimum" in schema and value < schema["minimum"]:
+            errors.append("{path} must be at least {minimum}".format(path=path, **schema))
+        if "maximum" in schema and value > schema["maximum"]:
+            errors.append("{path} must be at most {maximum}".format(path=path, **schema))
+    elif isinstance(value, dict):
+        for name in schema.get("required", ()):
+            if name not in value:
+                errors.append("{path}.{name} is required".format(path=path, name=name))
+        properties = schema.get("properties", {})
+        for name, item in value.items():
+            if name in properties:
+                validate_schema(properties[name], item, path + "." + name, errors)
+    elif isinstance(value, (list, tuple)) and "items" in schema:
+        for index, item in enumerate(value):
+            validate_schema(
+                schema["items"], item, "{path}[{index}]".format(path=path, index=index), errors
+            )
+    for entry in schema.get("allOf", ()):
+        validate_schema(entry, value, path, errors)
+    for key in ("anyOf", "oneOf"):
+        if key in schema:
+            for entry in schema[key]:
+                entry_errors = []
+                validate_schema(entry, value, path, entry_errors)
+                if not entry_errors:
+                    break
+            else:
+                errors.append("{path} does not match any allowed schema".format(path=path))
+
+
+def _body_schema(method_entry, api_spec):
+    """The schema used to validate request bodies, preferring the json one."""
+    content = method_entry.get("requestBody", {}).get("content", {})
+    candidates = [content_type for content_type in content if "schema" in content[content_type]]
+    if not candidates:
+        return None
+    candidates.sort(key=lambda content_type: not content_type.startswith("application/json"))
+    return compact_schema(content[candidates[0]]["schema"], api_spec)
+
+
+def request_schemas(api_spec, path, method):
+    """Return the compacted parameter schemas by name and body schema of an operation."""
+    path_entry = api_spec["paths"][path]
+    method_entry = path_entry[method]
+    parameter_schemas = {}
+    for entry in path_entry.get("parameters", []) + method_entry.get("parameters", []):
+        if entry["in"] not in BODY_PARAMETER_LOCATIONS and "schema" in entry:
+            parameter_schemas[entry["name"]] = compact_schema(entry["schema"], api_spec)
+    return parameter_schemas, _body_schema(method_entry, api_spec)
+
+
+def compile_schemas(api_spec, operations):
+    """Compact the request schemas of all compiled operations of an api spec.
+
+    The result maps each operationId to its [parameter_schemas, body_schema] and consists of
+    plain builtin types only, so it can be stored like the compiled api.
+    """
+    return dict(
+        (
+            operation_id,
+            list(request_schemas(api_spec, operation["path"], operation["method"])),
+        )
+        for operation_id, operation in operations.items()
+    )
@@ -47,6 +47,15 @@ options:
       - Time in seconds to wait for tasks.
     type: int
     default: 10
+  squeezer_stats:
+    description:
+      - Whether to report request statistics in the C(squeezer_stats) result.
+      - They contain the number, total and 95th percentile duration of the requests per operation,
+        the bytes sent and received, cache hits, retries and the time spent waiting for tasks.
+      - Modules using the legacy API client also report the connection reuse, transfer sizes and request counts of the client there.
+      - If no value is specified, the value of the environment variable C(SQUEEZER_STATS) will be used as a fallback.
+    type: bool
+    default: false
 """
 
     GLUE = r"""
@@ -67,6 +76,99 @@ options:
     required: false
 """
 
+    LEGACY = r"""
+options:
+  lookup_projection:
+    description:
+      - Whether entities that are only looked up to be referenced are fetched with just the fields needed for that.
+      - This uses the C(fields) parameter of the list endpoints and reduces the size of the responses.
+    type: bool
+    default: false
+  connection_pool_size:
+    description:
+      - Number of idle keep-alive connections to retain per host for reuse by subsequent requests.
+      - Set to C(0) to open a new connection for every request.
+    type: int
+    default: 10
+  api_cache_max_age:
+    description:
+      - Time in seconds after which the cached API specification is checked against the server.
+      - The specification is only downloaded again if the server reports a change.
+      - Set to C(0) to check on every call.
+    type: int
+    default: 3600
+  api_cache_mode:
+    description:
+      - How the API specification is stored in the cache.
+      - C(full) keeps the specification as downloaded from the server.
+      - C(slim) only keeps the operations with their parameters and request content types, which is a fraction of the size.
+        The full specification is downloaded again when it is needed.
+      - Servers running the same component versions share one cached specification.
+        It is removed from the cache once no server uses it anymore.
+    type: str
+    choices:
+      - full
+      - slim
+    default: full
+  api_cache_compression:
+    description:
+      - Compression of the API specification stored in the cache.
+      - C(zstd) requires the C(zstandard) python package.
+    type: str
+    choices:
+      - none
+      - gzip
+      - zstd
+    default: gzip
+  request_compression_min_size:
+    description:
+      - Size in bytes from which on request bodies are sent gzip compressed.
+      - This requires the server, or a proxy in front of it, to accept gzip encoded request bodies.
+      - If no value is specified, request bodies are never compressed.
+    type: int
+  response_spill_size:
+    description:
+      - Size in bytes from which on API responses are buffered in a temporary file instead of in memory.
+      - The entries of large list responses are then only decoded one at a time while they are processed.
+      - If no value is specified, responses are always kept in memory.
+    type: int
+  request_retries:
+    description:
+      - Number of times a request is retried when the server answers with 429, 502 or 503.
+      - Retries wait for the time the server asks for in C(Retry-After), or back off exponentially with jitter.
+      - Set to C(0) to fail on the first such answer.
+    type: int
+    default: 3
+  retry_budget_seconds:
+    description:
+      - Maximum time in seconds to spend waiting between retries of a single request.
+    type: int
+    default: 60
+  retry_methods:
+    description:
+      - HTTP methods that may be retried.
+      - If no value is specified, only idempotent methods (C(GET), C(HEAD), C(OPTIONS), C(PUT) and C(DELETE)) are retried.
+    type: list
+    elements: str
+    choices:
+      - GET
+      - HEAD
+      - OPTIONS
+      - PUT
+      - DELETE
+      - PATCH
+      - POST
+  validate_requests:
+    description:
+      - Whether to check request parameters and bodies against the schemas of the API specification before sending them.
+      - Invalid requests fail without reaching the server.
+        In check mode, the requests that would change the server are validated too.
+      - The schemas are extracted from the full API specification once and cached alongside it.
+        If only the slim specification is cached, the full one is downloaded for that once.
+    type: bool
+    default: false
+"""
+
     ENTITY_STATE = r"""
 options:
   state:
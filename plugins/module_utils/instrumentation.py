@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+# copyright (c) 2026, Matthias Dellweg
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import math
+import threading
+
+# Events fired by the api clients and the arguments passed to their callbacks:
+#   request_start(operation_id, method)
+#   request_end(operation_id, method, status, duration)
+#   bytes_sent(count)
+#   bytes_received(count)
+#   cache_hit(operation_id)
+#   retry(operation_id, delay)
+#   task_wait(duration)
+# Durations are in seconds. The status is None if no response was received.
+# Byte counts are of the bodies as transferred, i.e. before decompression.
+HOOK_EVENTS = (
+    "request_start",
+    "request_end",
+    "bytes_sent",
+    "bytes_received",
+    "cache_hit",
+    "retry",
+    "task_wait",
+)
+
+
+class Hooks(object):
+    """Callbacks to be notified about the requests of an api client."""
+
+    def __init__(self):
+        self._callbacks = dict((event, []) for event in HOOK_EVENTS)
+
+    def register(self, event, callback):
+        if event not in self._callbacks:
+            raise ValueError("Unknown hook event '{event}'.".format(event=event))
+        self._callbacks[event].append(callback)
+
+    def fire(self, event, *args):
+        for callback in self._callbacks[event]:
+            callback(*args)
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list of values."""
+    ordered = sorted(values)
+    return ordered[max(0, int(math.ceil(fraction * len(ordered))) - 1)]
+
+
+class RequestStats(object):
+    """Aggregate the events of an api client into the squeezer_stats result."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._durations = {}
+        self._counters = {
+            "bytes_sent": 0,
+            "bytes_received": 0,
+            "cache_hits": 0,
+            "retries": 0,
+            "task_wait_time": 0.0,
+        }
+
+    def attach(self, hooks):
+        hooks.register("request_end", self.request_end)
+        hooks.register("bytes_sent", self.bytes_sent)
+        hooks.register("bytes_received", self.bytes_received)
+        hooks.register("cache_hit", self.cache_hit)
+        hooks.register("retry", self.retry)
+        hooks.register("task_wait", self.task_wait)
+
+    def _add(self, counter, value):
+        with self._lock:
+            self._counters[counter] += value
+
+    def request_end(self, operation_id, method, status, duration):
+        with self._lock:
+            self._durations.setdefault(operation_id, []).append(duration)
+
+    def bytes_sent(self, count):
+        self._add("bytes_sent", count)
+
+    def bytes_received(self, count):
+        self._add("bytes_received", count)
+
+    def cache_hit(self, operation_id):
+        self._add("cache_hits", 1)
+
+    def retry(self, operation_id, delay):
+        self._add("retries", 1)
+
+    def task_wait(self, duration):
+        self._add("task_wait_time", duration)
+
+    def summary(self):
+        with self._lock:
+            durations = dict((key, list(value)) for key, value in self._durations.items())
+            result = dict(self._counters)
+        all_durations = [duration for values in durations.values() for duration in values]
+        result["requests"] = len(all_durations)
+        result["total_time"] = round(sum(all_durations), 6)
+        result["p95_time"] = round(percentile(all_durations, 0.95), 6) if all_durations else 0.0
+        result["task_wait_time"] = round(result["task_wait_time"], 6)
+        result["operations"] = dict(
+            (
+                operation_id,
+                {
+                    "count": len(values),
+                    "total_time": round(sum(values), 6),
+                    "p95_time": round(percentile(values, 0.95), 6),
+                },
+            )
+            for operation_id, values in durations.items()
+        )
+        return result
@@ -7,15 +7,56 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import codecs
+import contextlib
 import errno
+import fcntl
+import gzip
+import hashlib
+import itertools
 import json
+import marshal
+import mmap
 import os
+import random
+import re
+import shutil
+import socket
+import ssl
+import stat
+import struct
+import tempfile
+import threading
+import time
 import uuid
+import zlib
+from email.utils import mktime_tz, parsedate_tz
+from io import BytesIO
 
 from ansible.module_utils import six
-from ansible.module_utils._text import to_bytes
-from ansible.module_utils.six.moves.urllib.parse import urlencode, urljoin
-from ansible.module_utils.urls import Request
+from ansible.module_utils._text import to_bytes, to_native
+from ansible.module_utils.six.moves import collections_abc, http_client, queue
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible.module_utils.six.moves.urllib.parse import urlencode, urljoin, urlsplit
+from ansible.module_utils.six.moves.urllib.request import getproxies, proxy_bypass
+from ansible.module_utils.urls import (
+    Request,
+    basic_auth_header,
+    make_context,
+)
+from ansible_collections.pulp.squeezer.plugins.module_utils.instrumentation import Hooks
+from ansible_collections.pulp.squeezer.plugins.module_utils.validation import (
+    ValidationError,
+    compile_schemas,
+    validate_schema,
+)
+
+try:
+    import zstandard
+
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
 
 if six.PY2:
 
@@ -31,6 +72,1012 @@ else:
     makedirs = os.makedirs
 
 
+# Exceptions indicating that a kept-alive connection was closed by the server in the meantime.
+if six.PY2:
+    STALE_CONNECTION_ERRORS = (http_client.BadStatusLine, socket.error)
+else:
+    STALE_CONNECTION_ERRORS = (http_client.BadStatusLine, ConnectionResetError, BrokenPipeError)
+
+
+def parse_retry_after(value, now=None):
+    """Return the delay in seconds requested by a Retry-After header, or None."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+    date = parsedate_tz(value)
+    if date is None:
+        return None
+    return max(0, mktime_tz(date) - (time.time() if now is None else now))
+
+
+def send_request(connection, method, selector, data, headers):
+    if data is None or isinstance(data, bytes):
+        connection.request(method, selector, body=data, headers=headers)
+        return
+    # Stream the body to the socket chunk by chunk.
+    header_names = set(name.lower() for name in headers)
+    connection.putrequest(
+        method,
+        selector,
+        skip_host="host" in header_names,
+        skip_accept_encoding="accept-encoding" in header_names,
+    )
+    for name, value in headers.items():
+        connection.putheader(name, value)
+    connection.endheaders()
+    if isinstance(data, MultipartBody):
+        data.send(connection.sock)
+        return
+    for chunk in data:
+        connection.send(chunk)
+
+
+class PooledResponse(object):
+    """Response wrapper handing the connection back to the pool once the body was consumed."""
+
+    def __init__(self, pool, key, connection, response):
+        self._pool = pool
+        self._key = key
+        self._connection = connection
+        self._response = response
+        self.status = response.status
+        self.reason = response.reason
+        self.headers = response.msg
+
+    def getheader(self, name, default=None):
+        return self._response.getheader(name, default)
+
+    def read(self, amt=None):
+        data = self._response.read(amt)
+        if amt is None or not data:
+            self.release()
+        return data
+
+    def release(self):
+        if self._connection is not None:
+            if self._response.isclosed() and not getattr(self._response, "will_close", True):
+                self._pool.put(self._key, self._connection)
+            else:
+                self._connection.close()
+            self._connection = None
+
+    def close(self):
+        if self._connection is not None and not self._response.isclosed():
+            # The body was not consumed completely, so the connection cannot be reused.
+            self._connection.close()
+            self._connection = None
+        self._response.close()
+
+
+class DecodingResponse(object):
+    """Response wrapper transparently decompressing gzip or deflate encoded bodies while reading.
+
+    Reading a chunk may return more than `amt` bytes, as a chunk can decompress to more.
+    `count` is called with the number of bytes received before and after decompression.
+    """
+
+    def __init__(self, response, count=None):
+        self._response = response
+        self.status = getattr(response, "status", None) or response.getcode()
+        self.headers = response.headers
+        self._count = count
+        self._encoding = (self.headers.get("Content-Encoding") or "").strip().lower()
+        if self._encoding in ("gzip", "x-gzip", "deflate"):
+            # Accept both gzip and zlib headers.
+            self._decompressor = zlib.decompressobj(32 + zlib.MAX_WBITS)
+        else:
+            self._decompressor = None
+        self._started = False
+
+    def getheader(self, name, default=None):
+        return self.headers.get(name, default)
+
+    def _decompress(self, data):
+        try:
+            result = self._decompressor.decompress(data)
+        except zlib.error:
+            if self._started or self._encoding != "deflate":
+                raise
+            # Some servers send raw deflate streams without the zlib header.
+            self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+            result = self._decompressor.decompress(data)
+        self._started = True
+        return result
+
+    def read(self, amt=None):
+        while True:
+            data = self._response.read() if amt is None else self._response.read(amt)
+            received = len(data)
+            if self._decompressor is not None:
+                if data:
+                    data = self._decompress(data)
+                if amt is None or not received:
+                    data += self._decompressor.flush()
+            if self._count is not None:
+                self._count(received, len(data))
+            if data or amt is None or not received:
+                return data
+
+    def close(self):
+        self._response.close()
+
+
+class TLSSessionHTTPSConnection(http_client.HTTPSConnection):
+    """HTTPS connection offering a previous TLS session for resumption.
+
+    `on_handshake` is called with the handshake duration in seconds and whether the session
+    was resumed.
+    """
+
+    def __init__(self, host, tls_session=None, on_handshake=None, **kwargs):
+        http_client.HTTPSConnection.__init__(self, host, **kwargs)
+        self._tls_session = tls_session
+        self._on_handshake = on_handshake
+
+    def connect(self):
+        http_client.HTTPConnection.connect(self)
+        started = time.time()
+        self.sock = self._context.wrap_socket(
+            self.sock,
+            server_hostname=self._tunnel_host or self.host,
+            session=self._tls_session,
+        )
+        if self._on_handshake is not None:
+            self._on_handshake(time.time() - started, self.sock.session_reused)
+
+
+class UnixSocketHTTPConnection(http_client.HTTPConnection):
+    """HTTP connection to a server listening on a unix socket.
+
+    Unlike the one in ansible.module_utils.urls, the timeout also applies to connecting, so a
+    server with a full listen backlog cannot stall the module.
+    """
+
+    def __init__(self, unix_socket, host, **kwargs):
+        http_client.HTTPConnection.__init__(self, host, **kwargs)
+        self.unix_socket = unix_socket
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not socket._GLOBAL_DEFAULT_TIMEOUT:
+            sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.unix_socket)
+        except (socket.error, OSError) as e:
+            sock.close()
+            raise OSError("Invalid Socket File ({0}): {1}".format(self.unix_socket, e))
+        self.sock = sock
+
+
+class ConnectionPool(object):
+    """Keep-alive connections to the api server, reused across calls.
+
+    Connections are kept per (scheme, host) and up to `maxsize` idle connections are retained.
+    A `maxsize` of 0 disables reuse, opening a fresh connection for every request.
+    """
+
+    def __init__(self, unix_socket=None, validate_certs=True, timeout=10, maxsize=10):
+        self.unix_socket = unix_socket
+        self.validate_certs = validate_certs
+        self.timeout = timeout
+        self.maxsize = maxsize
+        self._ssl_context = None
+        self._idle = {}
+        self._lock = threading.Lock()
+        self._tls_sessions = {}
+        self.stats = {
+            "new": 0,
+            "reused": 0,
+            "tls_handshakes": 0,
+            "tls_resumed": 0,
+            "tls_handshake_time": 0.0,
+        }
+
+    @property
+    def ssl_context(self):
+        if self._ssl_context is None:
+            self._ssl_context = make_context(validate_certs=self.validate_certs)
+        return self._ssl_context
+
+    def _new_connection(self, key):
+        scheme, netloc = key
+        if self.unix_socket:
+            connection = UnixSocketHTTPConnection(self.unix_socket, netloc, timeout=self.timeout)
+        elif scheme == "https" and six.PY2:
+            connection = http_client.HTTPSConnection(
+                netloc, timeout=self.timeout, context=self.ssl_context
+            )
+        elif scheme == "https":
+            with self._lock:
+                tls_session = self._tls_sessions.get(key)
+            connection = TLSSessionHTTPSConnection(
+                netloc,
+                tls_session=tls_session,
+                on_handshake=self._count_handshake,
+                timeout=self.timeout,
+                context=self.ssl_context,
+            )
+        else:
+            connection = http_client.HTTPConnection(netloc, timeout=self.timeout)
+        with self._lock:
+            self.stats["new"] += 1
+        return connection
+
+    def _count_handshake(self, duration, resumed):
+        with self._lock:
+            self.stats["tls_handshakes"] += 1
+            self.stats["tls_resumed"] += int(resumed)
+            self.stats["tls_handshake_time"] += duration
+
+    def get(self, key):
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                self.stats["reused"] += 1
+                return idle.pop(), True
+        return self._new_connection(key), False
+
+    def put(self, key, connection):
+        # With TLS 1.3 the session ticket arrives after the handshake, so pick it up here.
+        tls_session = getattr(getattr(connection, "sock", None), "session", None)
+        with self._lock:
+            if tls_session is not None:
+                self._tls_sessions[key] = tls_session
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.maxsize:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def clear(self):
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+    def urlopen(self, method, url, data=None, headers=None):
+        """Send a request, following redirects like urllib does.
+
+        The Authorization header is only sent along to the host of the original url.
+        """
+        headers = dict(headers or {})
+        hostname = urlsplit(url).hostname
+        for _redirect in range(MAX_REDIRECTS + 1):
+            response = self._urlopen(method, url, data, headers)
+            location = response.getheader("Location")
+            if response.status not in REDIRECT_STATUS_CODES or not location:
+                return response
+            response.read()
+            response.close()
+            url = urljoin(url, location)
+            if response.status == 303 or (
+                response.status in (301, 302) and method not in ("GET", "HEAD")
+            ):
+                method = "GET" if method != "HEAD" else method
+                data = None
+                headers = dict(
+                    (name, value)
+                    for name, value in headers.items()
+                    if name.lower() not in ("content-type", "content-length", "content-encoding")
+                )
+            if urlsplit(url).hostname != hostname:
+                headers = dict(
+                    (name, value)
+                    for name, value in headers.items()
+                    if name.lower() != "authorization"
+                )
+        raise HTTPError(url, response.status, "Too many redirects.", response.headers, BytesIO(b""))
+
+    def _urlopen(self, method, url, data, headers):
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        selector = parts.path or "/"
+        if parts.query:
+            selector += "?" + parts.query
+        while True:
+            connection, reused = self.get(key)
+            try:
+                send_request(connection, method, selector, data, headers)
+                response = connection.getresponse()
+            except STALE_CONNECTION_ERRORS:
+                connection.close()
+                if reused:
+                    # The server dropped the idle connection; retry on a fresh one.
+                    continue
+                raise
+            except Exception:
+                connection.close()
+                raise
+            break
+        response = PooledResponse(self, key, connection, response)
+        if response.status >= 400:
+            body = DecodingResponse(response).read()
+            raise HTTPError(url, response.status, response.reason, response.headers, BytesIO(body))
+        return response
+
+
+CACHE_META_FILE = "api.meta.json"
+CACHE_LOCK_FILE = "api.lock"
+SPEC_CACHE_DIR = "specs"
+VERSIONS_INDEX_DIR = "versions"
+SPEC_HASH_RE = re.compile(r"^[0-9a-f]{64}$")
+CACHE_COMPRESSION_SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+COMPILED_SUFFIX = ".compiled"
+SCHEMAS_FILE = "api.schemas"
+# Bump this whenever the layout produced by compile_api or dump_compiled_api changes.
+COMPILED_VERSION = 4
+COMPILED_HEADER = struct.Struct(">II")
+UPLOAD_CHUNK_SIZE = 64 * 1024
+STREAM_CHUNK_SIZE = 64 * 1024
+JSON_WHITESPACE = " \t\n\r"
+PARAMETER_LOCATIONS = ("cookie", "header", "path", "query")
+PATH_PARAMETER_RE = re.compile(r"\{([^}]*)\}")
+HTTP_METHODS = {"get", "put", "post", "delete", "options", "head", "patch", "trace"}
+CACHEABLE_METHODS = {"get", "head"}
+IDEMPOTENT_METHODS = {"get", "head", "options", "put", "delete", "trace"}
+RETRY_STATUS_CODES = {429, 502, 503}
+REDIRECT_STATUS_CODES = {301, 302, 303, 307, 308}
+MAX_REDIRECTS = 10
+RETRY_BACKOFF_BASE = 0.5
+RETRY_BACKOFF_CAP = 30
+
+
+def compile_api(api_spec):
+    """Extract everything needed to perform calls from an api spec.
+
+    The result consists of plain builtin types only, so it can be stored with marshal.
+    """
+    if api_spec.get("swagger") == "2.0":
+        openapi_version = 2
+    elif api_spec.get("openapi", "").startswith("3."):
+        openapi_version = 3
+    else:
+        raise NotImplementedError("Unknown schema version")
+    operations = {}
+    for path, path_entry in api_spec["paths"].items():
+        for method, method_entry in path_entry.items():
+            if method not in HTTP_METHODS:
+                continue
+            parameters = {}
+            for entry in path_entry.get("parameters", []) + method_entry.get("parameters", []):
+                if entry["in"] not in PARAMETER_LOCATIONS:
+                    # Swagger 2.0 "body" and "formData" parameters are passed as the body.
+                    continue
+                parameters[(entry["in"], entry["name"])] = [
+                    entry["name"],
+                    entry["in"],
+                    entry.get("required", False),
+                ]
+            if openapi_version == 2:
+                content_types = (
+                    method_entry.get("consumes")
+                    or path_entry.get("consumes")
+                    or api_spec.get("consumes")
+                    or []
+                )
+            else:
+                content_types = list(method_entry.get("requestBody", {}).get("content", {}).keys())
+            operations[method_entry["operationId"]] = {
+                "method": method,
+                "path": path,
+                "parameters": list(parameters.values()),
+                "content_types": content_types,
+            }
+    return {
+        "openapi_version": openapi_version,
+        "info": api_spec.get("info", {}),
+        "operations": operations,
+    }
+
+
+def slim_api_spec(api_spec):
+    """Strip an api spec down to what is needed to perform calls.
+
+    Schemas, descriptions and responses are dropped. The result is still a valid input to
+    compile_api and is marked with "x-squeezer-slim".
+    """
+
+    def _parameters(entries):
+        return [
+            {"name": entry["name"], "in": entry["in"], "required": entry.get("required", False)}
+            for entry in entries
+        ]
+
+    slim = {"x-squeezer-slim": True, "info": api_spec.get("info", {}), "paths": {}}
+    for key in ("swagger", "openapi", "consumes"):
+        if key in api_spec:
+            slim[key] = api_spec[key]
+    for path, path_entry in api_spec["paths"].items():
+        slim_path_entry = {}
+        if "parameters" in path_entry:
+            slim_path_entry["parameters"] = _parameters(path_entry["parameters"])
+        if "consumes" in path_entry:
+            slim_path_entry["consumes"] = path_entry["consumes"]
+        for method, method_entry in path_entry.items():
+            if method not in HTTP_METHODS:
+                continue
+            slim_method_entry = {
+                "operationId": method_entry["operationId"],
+                "parameters": _parameters(method_entry.get("parameters", [])),
+            }
+            if "consumes" in method_entry:
+                slim_method_entry["consumes"] = method_entry["consumes"]
+            if "requestBody" in method_entry:
+                slim_method_entry["requestBody"] = {
+                    "content": dict(
+                        (content_type, {})
+                        for content_type in method_entry["requestBody"].get("content", {})
+                    )
+                }
+            slim_path_entry[method] = slim_method_entry
+        slim["paths"][path] = slim_path_entry
+    return slim
+
+
+def compress_spec(data, compression):
+    """Encode a serialized api spec for storage in the cache."""
+    if compression == "gzip":
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        return compressor.compress(data) + compressor.flush()
+    if compression == "zstd":
+        return zstandard.ZstdCompressor().compress(data)
+    return data
+
+
+def load_spec(f, compression):
+    """Parse an api spec from a cache file, decompressing it on the fly."""
+    if compression == "gzip":
+        f = gzip.GzipFile(fileobj=f, mode="rb")
+    elif compression == "zstd":
+        f = zstandard.ZstdDecompressor().stream_reader(f)
+    return json.load(f)
+
+
+def atomic_write(path, data):
+    """Replace the file at path, so concurrent readers never see partial content."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.rename(tmp_path, path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+
+
+def versions_fingerprint(versions, doc_path, domain_enabled):
+    """Digest identifying the api spec a server serves.
+
+    Servers with the same {component: version} mapping serve the same spec, unless the spec is
+    published at another path or domains add the {pulp_domain} parameter to every path.
+    """
+    return hashlib.sha256(
+        to_bytes(json.dumps([sorted(versions.items()), doc_path, bool(domain_enabled)]))
+    ).hexdigest()
+
+
+@contextlib.contextmanager
+def file_lock(path):
+    """Hold an exclusive lock on path across processes for the duration of the block.
+
+    Locking is best effort; if the lock file cannot be opened, the block runs unlocked.
+    """
+    try:
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    except (IOError, OSError):
+        fd = None
+    try:
+        if fd is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        if fd is not None:
+            # Closing the file releases the lock.
+            os.close(fd)
+
+
+def dump_compiled_api(compiled):
+    """Serialize a compiled api spec with an index of the individually marshalled operations.
+
+    Layout: version and header length, the marshalled header, followed by the operations.
+    The header carries the index mapping each operationId to (offset, length) of its entry.
+    """
+    index = {}
+    blobs = []
+    offset = 0
+    for operation_id, operation in compiled["operations"].items():
+        blob = marshal.dumps(operation)
+        index[operation_id] = [offset, len(blob)]
+        blobs.append(blob)
+        offset += len(blob)
+    header = dict(compiled, operations=index)
+    header_blob = marshal.dumps(header)
+    return b"".join([COMPILED_HEADER.pack(COMPILED_VERSION, len(header_blob)), header_blob] + blobs)
+
+
+def load_compiled_api(path):
+    """Memory-map a compiled api spec written by dump_compiled_api.
+
+    Only the header is decoded up front, operations are decoded on first access.
+    """
+    with open(path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    version, header_length = COMPILED_HEADER.unpack(buffer[: COMPILED_HEADER.size])
+    if version != COMPILED_VERSION:
+        raise ValueError("Incompatible precompiled api cache.")
+    start = COMPILED_HEADER.size + header_length
+    header = marshal.loads(buffer[COMPILED_HEADER.size : start])
+    header["operations"] = LazyOperations(buffer, header["operations"], start)
+    return header
+
+
+class LazyOperations(collections_abc.Mapping):
+    """Read-only mapping of operations decoded from a buffer on first access."""
+
+    def __init__(self, buffer, index, start=0):
+        self._buffer = buffer
+        self._index = index
+        self._start = start
+        self._operations = {}
+
+    def __getitem__(self, operation_id):
+        try:
+            return self._operations[operation_id]
+        except KeyError:
+            offset, length = self._index[operation_id]
+            offset += self._start
+            operation = marshal.loads(self._buffer[offset : offset + length])
+            self._operations[operation_id] = operation
+            return operation
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, operation_id):
+        return operation_id in self._index
+
+
+class FileRange(object):
+    """The part of an open file of `length` bytes starting at `start`, to be uploaded."""
+
+    def __init__(self, fileobj, start, length):
+        self.fileobj = fileobj
+        self.start = start
+        self.length = length
+
+
+class MultipartBody(object):
+    """A multipart/form-data request body that is streamed instead of assembled in memory.
+
+    Files can be given as bytes, memoryviews, (seekable) file objects or FileRanges. Their
+    content is only read in chunks while sending. The total length is known up front.
+    When sent to a socket, file content is not copied through python at all, see `send`.
+    """
+
+    def __init__(self, boundary):
+        self._part_boundary = b"--" + to_bytes(boundary, errors="surrogate_or_strict")
+        self._parts = []
+        self._length = 0
+
+    def _add(self, part):
+        if isinstance(part, FileRange):
+            length = part.length
+            self._parts.append((part.fileobj, part.start, length))
+        elif hasattr(part, "read"):
+            start = part.tell()
+            part.seek(0, os.SEEK_END)
+            length = part.tell() - start
+            part.seek(start)
+            self._parts.append((part, start, length))
+        else:
+            part = memoryview(part)
+            length = len(part)
+            self._parts.append(part)
+        self._length += length
+
+    def _add_header(self, *lines):
+        self._add(b"\r\n".join((self._part_boundary,) + lines + (b"", b"")))
+
+    def add_field(self, name, value):
+        b_name = to_bytes(name, errors="surrogate_or_strict")
+        self._add_header(b'Content-Disposition: form-data; name="%s"' % b_name)
+        self._add(to_bytes(value, errors="surrogate_or_strict") + b"\r\n")
+
+    def add_file(self, name, file_data):
+        b_name = to_bytes(name, errors="surrogate_or_strict")
+        self._add_header(
+            b'Content-Disposition: file; name="%s"; filename="%s"' % (b_name, b_name),
+            b"Content-Type: application/octet-stream",
+        )
+        self._add(file_data)
+        self._add(b"\r\n")
+
+    def close(self):
+        self._add(self._part_boundary + b"--")
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        for part in self._parts:
+            if isinstance(part, tuple):
+                for chunk in self._iter_file(*part):
+                    yield chunk
+            else:
+                yield part
+
+    def send(self, sock):
+        """Send the body to a connected socket.
+
+        File content goes out with sendfile on plain sockets. On TLS sockets, where the data
+        needs to be encrypted in userspace, it is sent from a memory map of the file instead.
+        Either way the file is not read into intermediate buffers.
+        """
+        for part in self._parts:
+            if not isinstance(part, tuple):
+                sock.sendall(part)
+            elif not (part[2] and self._send_file(sock, *part)):
+                for chunk in self._iter_file(*part):
+                    sock.sendall(chunk)
+
+    @staticmethod
+    def _send_file(sock, fileobj, start, length):
+        # Returns False if the file needs to be sent by reading it.
+        if six.PY2:
+            return False
+        try:
+            fileno = fileobj.fileno()
+        except (AttributeError, IOError, ValueError):
+            return False
+        file_stat = os.fstat(fileno)
+        if not stat.S_ISREG(file_stat.st_mode):
+            return False
+        if file_stat.st_size < start + length:
+            raise IOError("File to upload was truncated.")
+        if not isinstance(sock, ssl.SSLSocket):
+            sock.sendfile(fileobj, start, length)
+            return True
+        buffer = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+        try:
+            with memoryview(buffer) as view:
+                sock.sendall(view[start : start + length])
+        finally:
+            buffer.close()
+        return True
+
+    @staticmethod
+    def _iter_file(fileobj, start, length):
+        # Rewind, so the body can be sent again.
+        fileobj.seek(start)
+        while length > 0:
+            chunk = fileobj.read(min(length, UPLOAD_CHUNK_SIZE))
+            if not chunk:
+                raise IOError("File to upload was truncated.")
+            length -= len(chunk)
+            yield chunk
+
+
+class ResultsStream(object):
+    """Iterate over the "results" of a paginated list response while it is still being read.
+
+    Only the item currently processed is kept in memory in parsed form.
+    All other top-level fields of the page (like "count" and "next") are collected in `page`.
+    They are complete once the iteration finished.
+    """
+
+    def __init__(self, response, chunk_size=STREAM_CHUNK_SIZE):
+        self.page = {}
+        self.has_results = False
+        self._response = response
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size=0):
+        """Read at least one more chunk, and more until `size` characters are buffered."""
+        if self._eof:
+            raise ValueError("Unexpected end of JSON response.")
+        # Drop what was consumed already and join the new chunks only once.
+        pieces = [self._buffer[self._pos :]]
+        length = len(pieces[0])
+        while True:
+            chunk = self._response.read(self._chunk_size)
+            if not chunk:
+                self._eof = True
+            text = self._text_decoder.decode(chunk, final=self._eof)
+            pieces.append(text)
+            length += len(text)
+            if self._eof or length >= size:
+                break
+        self._buffer = "".join(pieces)
+        self._pos = 0
+
+    def _peek(self):
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in JSON_WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            self._fill()
+
+    def _expect(self, token):
+        if self._peek() != token:
+            raise ValueError(
+                "Unexpected '{0}' in JSON response, expected '{1}'.".format(self._peek(), token)
+            )
+        self._pos += 1
+
+    def _value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                # A value is always followed by a delimiter. If it is not buffered yet,
+                # the value itself may have been cut off (e.g. a number).
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            except ValueError:
+                if self._eof:
+                    raise
+            # Decoding starts over every time, so wait for twice the data to keep large
+            # items linear.
+            self._fill(2 * (len(self._buffer) - self._pos))
+
+    def _items(self):
+        self._expect("[")
+        if self._peek() != "]":
+            while True:
+                yield self._value()
+                if self._peek() == "]":
+                    break
+                self._expect(",")
+        self._pos += 1
+
+    def __iter__(self):
+        try:
+            self._expect("{")
+            if self._peek() != "}":
+                while True:
+                    key = self._value()
+                    self._expect(":")
+                    if key == "results" and self._peek() == "[":
+                        self.has_results = True
+                        for item in self._items():
+                            yield item
+                    else:
+                        self.page[key] = self._value()
+                    if self._peek() == "}":
+                        break
+                    self._expect(",")
+            # Consume the rest, so the connection can be reused.
+            while self._response.read(self._chunk_size):
+                pass
+        finally:
+            self._response.close()
+
+
+def read_response(response, spill_threshold=None):
+    """Read a response body into bytes.
+
+    Bodies larger than `spill_threshold` bytes are written to an anonymous temporary file
+    instead, which is returned rewound.
+    """
+    if spill_threshold is None:
+        return response.read()
+    chunks = []
+    length = 0
+    while length <= spill_threshold:
+        chunk = response.read(STREAM_CHUNK_SIZE)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+        length += len(chunk)
+    spill = tempfile.TemporaryFile(prefix="squeezer-")
+    try:
+        for chunk in chunks:
+            spill.write(chunk)
+        del chunks[:]
+        for chunk in iter(lambda: response.read(STREAM_CHUNK_SIZE), b""):
+            spill.write(chunk)
+        spill.seek(0)
+    except Exception:
+        spill.close()
+        raise
+    return spill
+
+
+class _Unclosable(object):
+    # Lets ResultsStream read a file without closing it, so it can be read again.
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+
+    def read(self, amt=None):
+        return self._fileobj.read(amt)
+
+    def close(self):
+        pass
+
+
+class SpilledResults(collections_abc.Sequence):
+    """The "results" of a list response that was spilled to a temporary file.
+
+    Items are parsed from the file whenever they are accessed, so only one of them is in memory
+    at a time. Iterating is cheap, indexing has to parse all preceding items.
+    """
+
+    def __init__(self, spill, length):
+        self._spill = spill
+        self._length = length
+
+    def __iter__(self):
+        self._spill.seek(0)
+        for item in ResultsStream(_Unclosable(self._spill)):
+            yield item
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("SpilledResults index out of range")
+        return next(itertools.islice(self, index, None))
+
+
+def load_spilled(spill):
+    """Decode a json response spilled to a file by read_response.
+
+    A list response is returned with its "results" as a SpilledResults, so they are not loaded
+    into memory. Any other response is decoded as a whole.
+    """
+    stream = ResultsStream(_Unclosable(spill))
+    length = sum(1 for _item in stream)
+    if not stream.has_results:
+        spill.close()
+        return stream.page
+    result = dict(stream.page)
+    result["results"] = SpilledResults(spill, length)
+    return result
+
+
+class Prefetch(object):
+    """Run a function on a background thread, keeping its result or exception."""
+
+    def __init__(self, func, *args):
+        self._result = None
+        self._error = None
+        self._thread = threading.Thread(target=self._run, args=(func,) + args)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self, func, *args):
+        try:
+            self._result = func(*args)
+        except Exception as e:
+            self._error = e
+
+    def result(self):
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+
+class CallPlan(object):
+    """Everything needed to perform an operation, prepared once per operationId.
+
+    Binding values to a plan only needs to sort the parameters into their locations.
+    """
+
+    def __init__(self, operation_id, operation):
+        self.operation_id = operation_id
+        self.method = operation["method"]
+        self.locations = {}
+        self.required = dict((location, []) for location in PARAMETER_LOCATIONS)
+        self.path = operation["path"]
+        # Filled in by OpenAPI.validate on first use.
+        self.parameter_schemas = None
+        self.body_schema = None
+        for name, location, required in operation["parameters"]:
+            # Like in the order of extraction, the first location wins on name clashes.
+            known_location = self.locations.get(name)
+            if known_location is None or PARAMETER_LOCATIONS.index(
+                location
+            ) < PARAMETER_LOCATIONS.index(known_location):
+                self.locations[name] = location
+            if required:
+                self.required[location].append(name)
+        # Literal segments at even, parameter names at odd indices.
+        self.path_segments = PATH_PARAMETER_RE.split(operation["path"])
+        content_types = operation["content_types"]
+        self.multipart = any(
+            (content_type.startswith("multipart/form-data") for content_type in content_types)
+        )
+        self.body_content_type = None
+        for candidate in ("application/json", "application/x-www-form-urlencoded"):
+            if any((content_type.startswith(candidate) for content_type in content_types)):
+                self.body_content_type = candidate
+                break
+
+    def validate(self, parameters=None, body=None, uploads=None):
+        """Check parameters and body against the request schemas without talking to the server.
+
+        Files passed as uploads are only checked for their presence.
+        """
+        errors = []
+        for name, value in (parameters or {}).items():
+            if name in (self.parameter_schemas or {}):
+                location = self.locations.get(name, "query")
+                validate_schema(self.parameter_schemas[name], value, location + "." + name, errors)
+        if self.body_schema is not None and (body is not None or uploads):
+            schema = self.body_schema
+            value = dict(body or {})
+            if uploads:
+                for name in uploads:
+                    value.pop(name, None)
+                schema = dict(
+                    schema,
+                    required=[name for name in schema.get("required", ()) if name not in uploads],
+                )
+            validate_schema(schema, value, "body", errors)
+        if errors:
+            raise ValidationError(
+                "Invalid request for {operation_id}: {errors}".format(
+                    operation_id=self.operation_id, errors="; ".join(errors)
+                )
+            )
+
+    def bind(self, parameters):
+        """Sort parameters into path, headers and query string."""
+        values = dict((location, {}) for location in PARAMETER_LOCATIONS)
+        unknown = []
+        for name, value in parameters.items():
+            location = self.locations.get(name)
+            if location is None:
+                unknown.append(name)
+            else:
+                values[location][name] = value
+        for location in PARAMETER_LOCATIONS:
+            missing = [name for name in self.required[location] if name not in values[location]]
+            if missing:
+                raise Exception(
+                    "Required parameters [{0}] missing for {1}.".format(
+                        ", ".join(missing), location
+                    )
+                )
+            if location == "cookie" and values["cookie"]:
+                raise NotImplementedError("Cookie parameters are not implemented.")
+        if unknown:
+            raise Exception(
+                "Parameter [{names}] not available for {operation_id}.".format(
+                    names=", ".join(unknown), operation_id=self.operation_id
+                )
+            )
+        segments = self.path_segments
+        if len(segments) == 1:
+            path = segments[0]
+        else:
+            path_values = values["path"]
+            path = "".join(
+                path_values[segment] if index % 2 else segment
+                for index, segment in enumerate(segments)
+            )
+        return path, values["header"], urlencode(values["query"], doseq=True)
+
+
 class OpenAPI:
     def __init__(
         self,
@@ -41,8 +1088,43 @@ class OpenAPI:
         validate_certs=True,
         refresh_cache=False,
         timeout=10,
+        pool_size=10,
+        cache_max_age=None,
+        compress_min_size=None,
+        max_retries=0,
+        retry_budget=60,
+        retry_methods=None,
+        cache_mode="full",
+        cache_compression="none",
+        validate_requests=False,
+        spill_threshold=None,
     ):
+        if cache_compression == "zstd" and not HAS_ZSTD:
+            raise ImportError("Compressing the api cache with zstd needs the zstandard package.")
         self.doc_path = doc_path
+        self.cache_mode = cache_mode
+        self.spill_threshold = spill_threshold
+        self.cache_compression = cache_compression
+        self.validate_requests = validate_requests
+        self.max_retries = max_retries
+        self.retry_budget = retry_budget
+        self.retry_methods = (
+            IDEMPOTENT_METHODS if retry_methods is None else {m.lower() for m in retry_methods}
+        )
+        self.cache_max_age = cache_max_age
+        self.compress_min_size = compress_min_size
+        self._stats_lock = threading.Lock()
+        self._transfer_stats = {
+            "sent": 0,
+            "sent_uncompressed": 0,
+            "received": 0,
+            "received_decompressed": 0,
+        }
+        self.hooks = Hooks()
+        self._request_stats = {"requests": 0, "cache_hits": 0, "retries": 0, "retry_delay": 0.0}
+        self._cache_lock = threading.Lock()
+        self._response_cache = {}
+        self._api_spec = None
 
         if base_url.startswith("unix:"):
             self.unix_socket = base_url.replace("unix:", "")
@@ -50,11 +1132,23 @@ class OpenAPI:
         else:
             self.unix_socket = None
             self.base_url = base_url
+        self._origin = urljoin(self.base_url, "/")[:-1]
 
         headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",
         }
+        if username is not None:
+            headers["Authorization"] = to_native(basic_auth_header(username, password))
+        self._headers = headers
+        self._pool = ConnectionPool(
+            unix_socket=self.unix_socket,
+            validate_certs=validate_certs,
+            timeout=timeout,
+            maxsize=pool_size,
+        )
+        # Used for requests that need to go through a proxy.
         self._session = Request(
             url_username=username,
             url_password=password,
@@ -67,136 +1161,368 @@ class OpenAPI:
         self.load_api(refresh_cache=refresh_cache)
 
     def load_api(self, refresh_cache=False):
-        # TODO: Find a way to invalidate caches on upstream change
+        # Parsed specs are shared by all servers, keyed by the hash of the spec. The cache
+        # directory of a server only points to the spec it serves.
         xdg_cache_home = os.environ.get("XDG_CACHE_HOME") or "~/.cache"
-        apidoc_cache = os.path.join(
-            os.path.expanduser(xdg_cache_home),
-            "squeezer",
-            self.base_url.replace(":", "_").replace("/", "_"),
-            "api.json",
+        cache_home = os.path.join(os.path.expanduser(xdg_cache_home), "squeezer")
+        self._cache_dir = os.path.join(
+            cache_home, self.base_url.replace(":", "_").replace("/", "_")
         )
+        self._specs_dir = os.path.join(cache_home, SPEC_CACHE_DIR)
+        started = time.time()
+        loaded = False
+        if not refresh_cache:
+            meta = self._read_cache_meta()
+            try:
+                self._load_cached_api(meta["spec"])
+                loaded = True
+            except Exception:
+                pass
+            else:
+                if not self._revalidation_due(meta):
+                    return
+
+        # Only one process at a time refreshes the cache, the others wait and reuse its result.
+        makedirs(self._cache_dir, exist_ok=True)
+        with file_lock(os.path.join(self._cache_dir, CACHE_LOCK_FILE)):
+            meta = self._read_cache_meta()
+            if meta.get("checked", 0) >= started:
+                # Someone else refreshed the cache while we were waiting for the lock.
+                try:
+                    self._load_cached_api(meta["spec"])
+                    return
+                except Exception:
+                    pass
+            if not (loaded or refresh_cache):
+                # Another server running the same versions may have cached the spec already.
+                spec_hash = self._find_spec_by_versions()
+                if spec_hash is not None:
+                    try:
+                        self._load_cached_api(spec_hash)
+                        # Make sure the spec was published under the same api root.
+                        status_path = self.operations["status_read"]["path"]
+                        if status_path != urlsplit(self._status_url()).path:
+                            raise ValueError("Cached api spec belongs to another api root.")
+                    except Exception:
+                        pass
+                    else:
+                        self._download_headers = {}
+                        self._write_cache_meta()
+                        self._prune_spec(meta.get("spec"))
+                        return
+            data = None
+            try:
+                if not loaded:
+                    raise IOError()
+                data = self._revalidate_api()
+            except Exception:
+                # Try again with a freshly downloaded version
+                data = self._download_api()
+            if data is not None:
+                self._store_api(data)
+                self._write_cache_meta()
+                self._prune_spec(meta.get("spec"))
+
+    def _spec_cache_path(self, spec_hash):
+        name = "api.slim.json" if self.cache_mode == "slim" else "api.json"
+        return os.path.join(
+            self._specs_dir, spec_hash, name + CACHE_COMPRESSION_SUFFIXES[self.cache_compression]
+        )
+
+    def _load_cached_api(self, spec_hash):
+        apidoc_cache = self._spec_cache_path(spec_hash)
         try:
-            if refresh_cache:
-                raise IOError()
+            self._load_compiled_api(apidoc_cache)
+        except Exception:
             with open(apidoc_cache, "rb") as f:
                 data = f.read()
-            self._parse_api(data)
+            self._api_spec = load_spec(BytesIO(data), self.cache_compression)
+            self._apply_compiled_api(compile_api(self._api_spec))
+            self._write_compiled_api(apidoc_cache, data)
+        self._spec_hash = spec_hash
+        self._apidoc_cache = apidoc_cache
+
+    def _store_api(self, data):
+        """Parse a downloaded api spec and add it to the shared spec cache."""
+        self._parse_api(data)
+        spec_hash = hashlib.sha256(data).hexdigest()
+        apidoc_cache = self._spec_cache_path(spec_hash)
+        if self.cache_mode == "slim":
+            data = to_bytes(json.dumps(slim_api_spec(self._api_spec)))
+        data = compress_spec(data, self.cache_compression)
+        makedirs(os.path.dirname(apidoc_cache), exist_ok=True)
+        # Write to cache as it seems to be valid
+        atomic_write(apidoc_cache, data)
+        self._write_compiled_api(apidoc_cache, data)
+        self._spec_hash = spec_hash
+        self._apidoc_cache = apidoc_cache
+        versions = self.info.get("x-pulp-app-versions")
+        if versions:
+            domain_enabled = any("{pulp_domain}" in path for path in self._api_spec["paths"])
+            fingerprint = versions_fingerprint(versions, self._doc_url_path(), domain_enabled)
+            index_dir = os.path.join(self._specs_dir, VERSIONS_INDEX_DIR)
+            try:
+                makedirs(index_dir, exist_ok=True)
+                atomic_write(os.path.join(index_dir, fingerprint), to_bytes(spec_hash))
+            except (IOError, OSError):
+                pass
+
+    def _prune_spec(self, spec_hash):
+        """Remove a spec this server no longer points to from the shared spec cache.
+
+        The spec is kept if the cache directory of any other server still points to it.
+        A server picking it up from the versions index concurrently only finds it missing
+        on its next run, and downloads it again.
+        """
+        if spec_hash == self._spec_hash or not SPEC_HASH_RE.match(spec_hash or ""):
+            return
+        cache_home = os.path.dirname(self._specs_dir)
+        index_dir = os.path.join(self._specs_dir, VERSIONS_INDEX_DIR)
+        try:
+            names = os.listdir(cache_home)
+        except (IOError, OSError):
+            return
+        for name in names:
+            try:
+                with open(os.path.join(cache_home, name, CACHE_META_FILE), "rb") as f:
+                    if json.loads(f.read()).get("spec") == spec_hash:
+                        return
+            except (IOError, OSError, ValueError, AttributeError):
+                pass
+        try:
+            # Unlist the spec first, so no other server starts using it.
+            for fingerprint in os.listdir(index_dir):
+                path = os.path.join(index_dir, fingerprint)
+                with open(path, "rb") as f:
+                    indexed = to_native(f.read().strip())
+                if indexed == spec_hash:
+                    os.remove(path)
+        except (IOError, OSError):
+            pass
+        shutil.rmtree(os.path.join(self._specs_dir, spec_hash), ignore_errors=True)
+
+    def _doc_url_path(self):
+        return urlsplit(urljoin(self.base_url, self.doc_path)).path
+
+    def _status_url(self):
+        return urljoin(urljoin(self.base_url, self.doc_path), "../status/")
+
+    def _find_spec_by_versions(self):
+        """Return the hash of a cached spec for the component versions of the server, or None.
+
+        The server is only asked for its versions if any spec was cached before.
+        """
+        index_dir = os.path.join(self._specs_dir, VERSIONS_INDEX_DIR)
+        try:
+            if not os.listdir(index_dir):
+                return None
+            status = json.loads(self._open("GET", self._status_url()).read())
+            versions = dict((item["component"], item["version"]) for item in status["versions"])
+            fingerprint = versions_fingerprint(
+                versions, self._doc_url_path(), status.get("domain_enabled", False)
+            )
+            with open(os.path.join(index_dir, fingerprint), "rb") as f:
+                return to_native(f.read().strip())
         except Exception:
-            # Try again with a freshly downloaded version
-            data = self._download_api()
-            self._parse_api(data)
-            # Write to cache as it seems to be valid
-            makedirs(os.path.dirname(apidoc_cache), exist_ok=True)
-            with open(apidoc_cache, "wb") as f:
-                f.write(data)
+            return None
 
     def _parse_api(self, data):
-        self.api_spec = json.loads(data)
-        if self.api_spec.get("swagger") == "2.0":
-            self.openapi_version = 2
-        elif self.api_spec.get("openapi", "").startswith("3."):
-            self.openapi_version = 3
-        else:
-            raise NotImplementedError("Unknown schema version")
-        self.operations = {
-            method_entry["operationId"]: (method, path)
-            for path, path_entry in self.api_spec["paths"].items()
-            for method, method_entry in path_entry.items()
-            if method in {"get", "put", "post", "delete", "options", "head", "patch", "trace"}
-        }
+        self._api_spec = json.loads(data)
+        self._apply_compiled_api(compile_api(self._api_spec))
 
-    def _download_api(self):
-        return self._session.open(
-            "GET", urljoin(self.base_url, self.doc_path), unix_socket=self.unix_socket
-        ).read()
+    def _apply_compiled_api(self, compiled):
+        self.openapi_version = compiled["openapi_version"]
+        self.info = compiled["info"]
+        self.operations = compiled["operations"]
+        self._plans = {}
+        self._schemas = None
 
-    def extract_params(self, param_type, path_spec, method_spec, params):
-        param_spec = {
-            entry["name"]: entry
-            for entry in path_spec.get("parameters", [])
-            if entry["in"] == param_type
-        }
-        param_spec.update(
-            {
-                entry["name"]: entry
-                for entry in method_spec.get("parameters", [])
-                if entry["in"] == param_type
-            }
-        )
-        result = {}
-        for name in list(params.keys()):
-            if name in param_spec:
-                param_spec.pop(name)
-                result[name] = params.pop(name)
-        remaining_required = [
-            item["name"] for item in param_spec.values() if item.get("required", False)
-        ]
-        if any(remaining_required):
-            raise Exception(
-                "Required parameters [{0}] missing for {1}.".format(
-                    ", ".join(remaining_required), param_type
+    def _load_compiled_api(self, apidoc_cache):
+        compiled = load_compiled_api(apidoc_cache + COMPILED_SUFFIX)
+        file_stat = os.stat(apidoc_cache)
+        if compiled["source"] != [file_stat.st_size, file_stat.st_mtime]:
+            # The api spec was touched, check whether its content actually changed.
+            with open(apidoc_cache, "rb") as f:
+                data = f.read()
+            if hashlib.sha256(data).hexdigest() != compiled["spec_hash"]:
+                raise ValueError("Precompiled api cache is outdated.")
+            compiled["operations"] = dict(compiled["operations"])
+            self._write_compiled_api(apidoc_cache, data, compiled)
+        self._api_spec = None
+        self._apply_compiled_api(compiled)
+
+    def _write_compiled_api(self, apidoc_cache, data, compiled=None):
+        if compiled is None:
+            compiled = compile_api(self._api_spec)
+            compiled["spec_hash"] = hashlib.sha256(data).hexdigest()
+        file_stat = os.stat(apidoc_cache)
+        compiled["source"] = [file_stat.st_size, file_stat.st_mtime]
+        try:
+            atomic_write(apidoc_cache + COMPILED_SUFFIX, dump_compiled_api(compiled))
+        except (IOError, OSError):
+            # The precompiled cache is an optimization only.
+            pass
+
+    @property
+    def api_spec(self):
+        if self._api_spec is None:
+            with open(self._apidoc_cache, "rb") as f:
+                api_spec = load_spec(f, self.cache_compression)
+            if api_spec.get("x-squeezer-slim"):
+                # Only the slimmed spec is cached, fetch the full one.
+                api_spec = json.loads(self._download_api())
+            self._api_spec = api_spec
+        return self._api_spec
+
+    @property
+    def connection_stats(self):
+        return dict(self._pool.stats)
+
+    def _use_proxy(self, url):
+        if self.unix_socket:
+            return False
+        parts = urlsplit(url)
+        return parts.scheme in getproxies() and not proxy_bypass(parts.hostname)
+
+    @property
+    def transfer_stats(self):
+        with self._stats_lock:
+            return dict(self._transfer_stats)
+
+    def _count_sent(self, wire, uncompressed):
+        with self._stats_lock:
+            self._transfer_stats["sent"] += wire
+            self._transfer_stats["sent_uncompressed"] += uncompressed
+        self.hooks.fire("bytes_sent", wire)
+
+    def _count_received(self, wire, decompressed):
+        with self._stats_lock:
+            self._transfer_stats["received"] += wire
+            self._transfer_stats["received_decompressed"] += decompressed
+        self.hooks.fire("bytes_received", wire)
+
+    def _compress_body(self, data, headers):
+        """Gzip a rendered (non-streamed) request body if it is large enough to be worth it."""
+        if (
+            self.compress_min_size is None
+            or isinstance(data, MultipartBody)
+            or len(data) < self.compress_min_size
+        ):
+            return data
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        data = compressor.compress(to_bytes(data)) + compressor.flush()
+        headers["Content-Encoding"] = "gzip"
+        headers["Content-Length"] = len(data)
+        return data
+
+    def _open(self, method, url, data=None, headers=None):
+        if self._use_proxy(url):
+            try:
+                response = self._session.open(
+                    method, url, data=data, headers=headers, decompress=False
                 )
+            except HTTPError as e:
+                e.fp = BytesIO(DecodingResponse(e).read())
+                raise
+        else:
+            request_headers = dict(self._headers)
+            if headers:
+                request_headers.update(headers)
+            response = self._pool.urlopen(
+                method.upper(),
+                url,
+                data=to_bytes(data, nonstring="passthru"),
+                headers=request_headers,
             )
-        return result
+        return DecodingResponse(response, self._count_received)
+
+    def _download_api(self, headers=None):
+        response = self._open("GET", urljoin(self.base_url, self.doc_path), headers=headers)
+        self._download_headers = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        return response.read()
+
+    def _read_cache_meta(self):
+        try:
+            with open(os.path.join(self._cache_dir, CACHE_META_FILE), "rb") as f:
+                return json.loads(f.read())
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def _write_cache_meta(self, meta=None):
+        if meta is None:
+            meta = dict(self._download_headers)
+        meta["spec"] = self._spec_hash
+        meta["checked"] = time.time()
+        try:
+            atomic_write(os.path.join(self._cache_dir, CACHE_META_FILE), to_bytes(json.dumps(meta)))
+        except (IOError, OSError):
+            pass
 
-    def render_body(self, path_spec, method_spec, headers, body=None, uploads=None):
+    def _revalidation_due(self, meta):
+        if self.cache_max_age is None:
+            return False
+        checked = meta.get("checked", 0)
+        return time.time() - checked >= self.cache_max_age
+
+    def _revalidate_api(self):
+        """Check whether the cached api spec is still current.
+
+        Returns the freshly downloaded api spec if it changed upstream, None otherwise.
+        """
+        meta = self._read_cache_meta()
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        if headers:
+            try:
+                data = self._download_api(headers=headers)
+            except HTTPError as e:
+                # Only urllib raises on "304 Not Modified".
+                if e.code != 304:
+                    raise
+                data = None
+            if data:
+                return data
+        else:
+            cached_versions = self.info.get("x-pulp-app-versions")
+            if cached_versions is None or "status_read" not in self.operations:
+                # There is no cheap way to tell, so compare to a freshly downloaded spec.
+                return self._download_api()
+            status = self.call("status_read")
+            server_versions = {item["component"]: item["version"] for item in status["versions"]}
+            if server_versions != cached_versions:
+                return self._download_api()
+        self._write_cache_meta(meta)
+        return None
+
+    def render_body(self, plan, headers, body=None, uploads=None):
         if not (body or uploads):
             return None
-        if self.openapi_version == 2:
-            content_types = (
-                method_spec.get("consumes")
-                or path_spec.get("consumes")
-                or self.api_spec.get("consumes")
-            )
-        else:
-            content_types = list(method_spec["requestBody"]["content"].keys())
         if uploads:
             body = body or {}
-            if any(
-                (content_type.startswith("multipart/form-data") for content_type in content_types)
-            ):
+            if plan.multipart:
                 boundary = uuid.uuid4().hex
-                part_boundary = b"--" + to_bytes(boundary, errors="surrogate_or_strict")
-
-                form = []
+                data = MultipartBody(boundary)
                 for key, value in body.items():
-                    b_key = to_bytes(key, errors="surrogate_or_strict")
-                    form.extend(
-                        [
-                            part_boundary,
-                            b'Content-Disposition: form-data; name="%s"' % b_key,
-                            b"",
-                            to_bytes(value, errors="surrogate_or_strict"),
-                        ]
-                    )
+                    data.add_field(key, value)
                 for key, file_data in uploads.items():
-                    b_key = to_bytes(key, errors="surrogate_or_strict")
-                    form.extend(
-                        [
-                            part_boundary,
-                            b'Content-Disposition: file; name="%s"; filename="%s"' % (b_key, b_key),
-                            b"Content-Type: application/octet-stream",
-                            b"",
-                            file_data,
-                        ]
-                    )
-                form.append(part_boundary + b"--")
-                data = b"\r\n".join(form)
+                    data.add_file(key, file_data)
+                data.close()
                 headers["Content-Type"] = "multipart/form-data; boundary={boundary}".format(
                     boundary=boundary
                 )
             else:
                 raise Exception("No suitable content type for file upload specified.")
         elif body:
-            if any((content_type.startswith("application/json") for content_type in content_types)):
+            if plan.body_content_type == "application/json":
                 data = json.dumps(body)
                 headers["Content-Type"] = "application/json"
-            elif any(
-                (
-                    content_type.startswith("application/x-www-form-urlencoded")
-                    for content_type in content_types
-                )
-            ):
+            elif plan.body_content_type == "application/x-www-form-urlencoded":
                 data = urlencode(body)
                 headers["Content-Type"] = "application/x-www-form-urlencoded"
             else:
@@ -204,43 +1530,273 @@ class OpenAPI:
         headers["Content-Length"] = len(data)
         return data
 
-    def call(self, operation_id, parameters=None, body=None, uploads=None):
-        method, path = self.operations[operation_id]
-        path_spec = self.api_spec["paths"][path]
-        method_spec = path_spec[method]
+    def plan(self, operation_id):
+        try:
+            return self._plans[operation_id]
+        except KeyError:
+            plan = CallPlan(operation_id, self.operations[operation_id])
+            self._plans[operation_id] = plan
+            return plan
 
-        if parameters is None:
-            parameters = {}
-        else:
-            parameters = parameters.copy()
+    def _url(self, path):
+        if path.startswith("/"):
+            return self._origin + path
+        return urljoin(self.base_url, path)
+
+    def _prepare(self, operation_id, parameters=None):
+        plan = self.plan(operation_id)
+        path, headers, query_string = plan.bind(parameters or {})
+        url = self._url(path)
+        if query_string:
+            url += "?" + query_string
+        return plan, url, headers
 
-        if any(self.extract_params("cookie", path_spec, method_spec, parameters)):
-            raise NotImplementedError("Cookie parameters are not implemented.")
+    def _request(self, plan, url, headers, body=None, uploads=None):
+        data = self.render_body(plan, headers, body, uploads)
+        if data is not None:
+            uncompressed = len(data)
+            data = self._compress_body(data, headers)
+            self._count_sent(len(data), uncompressed)
 
-        headers = self.extract_params("header", path_spec, method_spec, parameters)
+        deadline = None
+        attempt = 0
+        while True:
+            with self._stats_lock:
+                self._request_stats["requests"] += 1
+            self.hooks.fire("request_start", plan.operation_id, plan.method)
+            started = time.time()
+            try:
+                response = self._open(plan.method, url, data=data, headers=headers)
+            except HTTPError as e:
+                self.hooks.fire(
+                    "request_end",
+                    plan.operation_id,
+                    plan.method,
+                    e.code,
+                    time.time() - started,
+                )
+                if deadline is None:
+                    deadline = time.time() + self.retry_budget
+                delay = self._retry_delay(plan.method, e, attempt, deadline)
+                if delay is None:
+                    raise
+            except Exception:
+                self.hooks.fire(
+                    "request_end", plan.operation_id, plan.method, None, time.time() - started
+                )
+                raise
+            else:
+                self.hooks.fire(
+                    "request_end",
+                    plan.operation_id,
+                    plan.method,
+                    response.status,
+                    time.time() - started,
+                )
+                return response
+            attempt += 1
+            with self._stats_lock:
+                self._request_stats["retries"] += 1
+                self._request_stats["retry_delay"] += delay
+            self.hooks.fire("retry", plan.operation_id, delay)
+            time.sleep(delay)
 
-        for name, value in self.extract_params("path", path_spec, method_spec, parameters).items():
-            path = path.replace("{" + name + "}", value)
+    def _retry_delay(self, method, error, attempt, deadline):
+        """Return how long to wait before retrying a failed request, or None to give up.
 
-        query_string = urlencode(
-            self.extract_params("query", path_spec, method_spec, parameters), doseq=True
-        )
+        The server's Retry-After is honored, otherwise the delay grows exponentially with full
+        jitter. No retry is attempted if the wait would exceed the retry budget.
+        """
+        if (
+            error.code not in RETRY_STATUS_CODES
+            or method not in self.retry_methods
+            or attempt >= self.max_retries
+        ):
+            return None
+        headers = error.info()
+        delay = parse_retry_after(headers.get("Retry-After") if headers else None)
+        if delay is None:
+            delay = random.uniform(0, min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * 2**attempt))
+        if time.time() + delay > deadline:
+            return None
+        return delay
 
-        if any(parameters):
-            raise Exception(
-                "Parameter [{names}] not available for {operation_id}.".format(
-                    names=", ".join(parameters.keys()), operation_id=operation_id
-                )
-            )
-        url = urljoin(self.base_url, path)
-        if query_string:
-            url += "?" + query_string
+    @property
+    def request_stats(self):
+        with self._stats_lock:
+            return dict(self._request_stats)
 
-        data = self.render_body(path_spec, method_spec, headers, body, uploads)
+    def clear_cache(self):
+        """Forget all memoized responses."""
+        with self._cache_lock:
+            self._response_cache.clear()
 
-        result = self._session.open(
-            method, url, data=data, headers=headers, unix_socket=self.unix_socket
-        ).read()
+    def _invalidate(self, url):
+        """Drop memoized responses for resources above or below the written url."""
+        path = url.split("?", 1)[0]
+        with self._cache_lock:
+            for key in list(self._response_cache):
+                cached_path = key.split("?", 1)[0]
+                if cached_path.startswith(path) or path.startswith(cached_path):
+                    del self._response_cache[key]
+
+    def call(self, operation_id, parameters=None, body=None, uploads=None, cache=True):
+        """Perform an operation and return the decoded json response.
+
+        Responses to safe methods are memoized for the lifetime of this object. Any other
+        method invalidates the memoized responses of the resource it writes to. Pass
+        `cache=False` to always ask the server, e.g. when polling.
+
+        Responses larger than `spill_threshold` are kept in a temporary file instead, and are
+        neither memoized nor fully decoded, see load_spilled.
+        """
+        if self.validate_requests:
+            self.validate(operation_id, parameters, body, uploads)
+        plan, url, headers = self._prepare(operation_id, parameters)
+        if plan.method in CACHEABLE_METHODS:
+            result = None
+            if cache:
+                with self._cache_lock:
+                    result = self._response_cache.get(url)
+            if result is None:
+                result = read_response(
+                    self._request(plan, url, headers, body, uploads), self.spill_threshold
+                )
+                if cache and isinstance(result, bytes):
+                    with self._cache_lock:
+                        self._response_cache[url] = result
+            else:
+                with self._stats_lock:
+                    self._request_stats["cache_hits"] += 1
+                self.hooks.fire("cache_hit", operation_id)
+        else:
+            try:
+                result = read_response(
+                    self._request(plan, url, headers, body, uploads), self.spill_threshold
+                )
+            finally:
+                self._invalidate(url)
+        if not isinstance(result, bytes):
+            return load_spilled(result)
         if result:
             return json.loads(result)
         return None
+
+    def _request_schemas(self):
+        """The compacted request schemas of all operations, see compile_schemas.
+
+        They are extracted from the full api spec once and stored next to it in the spec cache.
+        """
+        if self._schemas is None:
+            schemas_cache = os.path.join(os.path.dirname(self._apidoc_cache), SCHEMAS_FILE)
+            try:
+                self._schemas = load_compiled_api(schemas_cache)["operations"]
+            except Exception:
+                schemas = compile_schemas(self.api_spec, self.operations)
+                try:
+                    atomic_write(schemas_cache, dump_compiled_api({"operations": schemas}))
+                except (IOError, OSError):
+                    # Caching the schemas is an optimization only.
+                    pass
+                self._schemas = schemas
+        return self._schemas
+
+    def validate(self, operation_id, parameters=None, body=None, uploads=None):
+        """Check a call against the request schemas of the api spec, raising ValidationError."""
+        plan = self.plan(operation_id)
+        if plan.parameter_schemas is None:
+            plan.parameter_schemas, plan.body_schema = self._request_schemas()[operation_id]
+        plan.validate(parameters, body, uploads)
+
+    def call_many(self, calls, max_workers=4, cache=True):
+        """Perform independent calls concurrently on a pool of threads.
+
+        `calls` is a sequence of (operation_id, parameters, body) tuples.
+        The results are returned in the same order. A call that failed is represented by the
+        exception it raised. `cache` is passed on to every call.
+        """
+        if max_workers < 1:
+            raise ValueError("call_many needs at least one worker.")
+        calls = list(calls)
+        results = [None] * len(calls)
+        pending = queue.Queue()
+        for index, call in enumerate(calls):
+            pending.put((index, call))
+
+        def _worker():
+            while True:
+                try:
+                    index, call = pending.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    results[index] = self.call(*call, cache=cache)
+                except Exception as e:
+                    results[index] = e
+
+        workers = [threading.Thread(target=_worker) for _ in range(min(max_workers, len(calls)))]
+        if len(workers) == 1:
+            _worker()
+        else:
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        return results
+
+    def iterate(self, operation_id, parameters=None, page_size=None, prefetch=True):
+        """Iterate over the entries of all pages of a list operation, following "next" links.
+
+        Pages are parsed while they are read, so at most the current and the next page are held
+        in memory, or in a temporary file past `spill_threshold`. With `prefetch`, the next page
+        is downloaded on a background thread as soon as its link is known, while the caller
+        consumes the current one.
+        """
+        parameters = dict(parameters or {})
+        if page_size is not None:
+            parameters["limit"] = page_size
+        if self.validate_requests:
+            self.validate(operation_id, parameters)
+        plan, url, headers = self._prepare(operation_id, parameters)
+        response = self._request(plan, url, dict(headers))
+        pending = None
+        try:
+            while response is not None:
+                page = ResultsStream(response)
+                response = None
+                for item in page:
+                    if prefetch and pending is None and page.page.get("next"):
+                        pending = Prefetch(self._fetch_page, plan, page.page["next"], headers)
+                    yield item
+                if pending is not None:
+                    pending, response = None, pending.result()
+                elif page.page.get("next"):
+                    response = self._fetch_page(plan, page.page["next"], headers)
+        finally:
+            if pending is not None:
+                # Stopped early, release the page downloaded in the meantime.
+                try:
+                    pending.result().close()
+                except Exception:
+                    pass
+
+    def _fetch_page(self, plan, link, headers):
+        # Only follow the path and query of the link, the server may not know its public url.
+        parts = urlsplit(link)
+        url = self._url(parts.path)
+        if parts.query:
+            url += "?" + parts.query
+        result = read_response(self._request(plan, url, dict(headers)), self.spill_threshold)
+        if isinstance(result, bytes):
+            return BytesIO(result)
+        return result
+
+    def stream(self, operation_id, parameters=None):
+        """Perform a list operation, parsing the page while it is read.
+
+        Returns a ResultsStream yielding the entries of "results" one by one.
+        """
+        if self.validate_requests:
+            self.validate(operation_id, parameters)
+        plan, url, headers = self._prepare(operation_id, parameters)
+        return ResultsStream(self._request(plan, url, headers))
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+# copyright (c) 2026, Matthias Dellweg
+# GNU General Public License v3.0+ (see LICENSE or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible_collections.pulp.squeezer.plugins.module_utils.openapi import OpenAPI
+
+
+class AsyncOpenAPI:
+    """Asyncio interface to an OpenAPI client.
+
+    Spec loading, call plans and the connection pool are shared with the wrapped `OpenAPI`
+    instance. Requests are performed by a bounded set of worker threads, so independent calls
+    overlap their network latency while the event loop stays responsive.
+    """
+
+    def __init__(self, openapi, max_concurrency=4):
+        if not isinstance(openapi, OpenAPI):
+            raise TypeError("AsyncOpenAPI needs an OpenAPI instance to wrap.")
+        self.openapi = openapi
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_class, exc_value, tb):
+        self.close()
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    async def call(self, operation_id, parameters=None, body=None, uploads=None):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            functools.partial(self.openapi.call, operation_id, parameters, body, uploads),
+        )
+
+    async def gather(self, *aws, return_exceptions=False):
+        """Like asyncio.gather, returning the results in the order of `aws`.
+
+        The calls among `aws` share the worker threads, so at most `max_concurrency` of them
+        are performed at a time.
+        """
+        return await asyncio.gather(*aws, return_exceptions=return_exceptions)
@@ -12,15 +12,22 @@ __metaclass__ = type
 import os
 import re
 import traceback
-from time import sleep
+from time import sleep, time
 
-from ansible.module_utils.basic import AnsibleModule, env_fallback
+from ansible.module_utils.basic import AnsibleModule, env_fallback, missing_required_lib
 
 # from ansible.module_utils.common import yaml
 from ansible.module_utils.six.moves.urllib.error import HTTPError
-from ansible_collections.pulp.squeezer.plugins.module_utils.openapi import OpenAPI
+from ansible_collections.pulp.squeezer.plugins.module_utils.instrumentation import RequestStats
+from ansible_collections.pulp.squeezer.plugins.module_utils.openapi import (
+    HAS_ZSTD,
+    FileRange,
+    OpenAPI,
+)
+from ansible_collections.pulp.squeezer.plugins.module_utils.validation import ValidationError
 
 PAGE_LIMIT = 20
+LIST_CONCURRENCY = 4
 CONTENT_CHUNK_SIZE = 512 * 1024  # 1/2 MB
 
 
@@ -60,12 +67,34 @@ class PulpAnsibleModule(AnsibleModule):
             },
             "refresh_api_cache": {"type": "bool", "default": False},
             "timeout": {"type": "int", "required": False, "default": 10},
+            "validate_requests": {"type": "bool", "default": False},
+            "lookup_projection": {"type": "bool", "default": False},
+            "squeezer_stats": {
+                "type": "bool",
+                "default": False,
+                "fallback": (env_fallback, ["SQUEEZER_STATS"]),
+            },
+            "connection_pool_size": {"type": "int", "default": 10},
+            "api_cache_max_age": {"type": "int", "default": 3600},
+            "api_cache_mode": {"choices": ["full", "slim"], "default": "full"},
+            "api_cache_compression": {"choices": ["none", "gzip", "zstd"], "default": "gzip"},
+            "request_compression_min_size": {"type": "int"},
+            "response_spill_size": {"type": "int"},
+            "request_retries": {"type": "int", "default": 3},
+            "retry_budget_seconds": {"type": "int", "default": 60},
+            "retry_methods": {
+                "type": "list",
+                "elements": "str",
+                "choices": ["GET", "HEAD", "OPTIONS", "PUT", "DELETE", "PATCH", "POST"],
+            },
         }
         argument_spec.update(kwargs.pop("argument_spec", {}))
         supports_check_mode = kwargs.pop("supports_check_mode", True)
         super(PulpAnsibleModule, self).__init__(
             argument_spec=argument_spec, supports_check_mode=supports_check_mode, **kwargs
         )
+        if self.params["api_cache_compression"] == "zstd" and not HAS_ZSTD:
+            self.fail_json(msg=missing_required_lib("zstandard"))
 
     def __enter__(self):
         self._changed = False
@@ -78,21 +107,37 @@ class PulpAnsibleModule(AnsibleModule):
             validate_certs=self.params["validate_certs"],
             refresh_cache=self.params["refresh_api_cache"],
             timeout=self.params["timeout"],
+            pool_size=self.params["connection_pool_size"],
+            cache_max_age=self.params["api_cache_max_age"],
+            cache_mode=self.params["api_cache_mode"],
+            cache_compression=self.params["api_cache_compression"],
+            compress_min_size=self.params["request_compression_min_size"],
+            max_retries=self.params["request_retries"],
+            retry_budget=self.params["retry_budget_seconds"],
+            retry_methods=self.params["retry_methods"],
+            validate_requests=self.params["validate_requests"],
+            spill_threshold=self.params["response_spill_size"],
         )
+        self._stats = None
+        if self.params["squeezer_stats"]:
+            self._stats = RequestStats()
+            self._stats.attach(self.pulp_api.hooks)
 
         return self
 
     def __exit__(self, exc_class, exc_value, tb):
         if exc_class is None:
+            self._results.update(self._stats_results())
             self.exit_json(changed=self._changed, **self._results)
         else:
-            if issubclass(exc_class, SqueezerException):
-                self.fail_json(msg=str(exc_value), changed=self._changed)
+            if issubclass(exc_class, (SqueezerException, ValidationError)):
+                self.fail_json(msg=str(exc_value), changed=self._changed, **self._stats_results())
                 return True
             elif issubclass(exc_class, HTTPError):
                 self.fail_json(
                     msg="{0} {1}".format(str(exc_value), str(exc_value.fp.read())),
                     changed=self._changed,
+                    **self._stats_results()
                 )
                 return True
             elif issubclass(exc_class, Exception):
@@ -100,9 +145,20 @@ class PulpAnsibleModule(AnsibleModule):
                     msg=str(exc_value),
                     changed=self._changed,
                     exception="\n".join(traceback.format_exception(exc_class, exc_value, tb)),
+                    **self._stats_results()
                 )
                 return True
 
+    def _stats_results(self):
+        # Reported on failures too, that is when the timings matter most.
+        if self._stats is None:
+            return {}
+        stats = self._stats.summary()
+        stats["connection_stats"] = self.pulp_api.connection_stats
+        stats["transfer_stats"] = self.pulp_api.transfer_stats
+        stats["request_stats"] = self.pulp_api.request_stats
+        return {"squeezer_stats": stats}
+
     def set_changed(self):
         self._changed = True
 
@@ -148,6 +204,9 @@ class PulpRemoteAnsibleModule(PulpEntityAnsibleModule):
 
 
 class PulpEntity(object):
+    # Fields needed when the entity is only looked up to be referenced by another one.
+    _lookup_fields = ("pulp_href",)
+
     def __init__(self, module, natural_key=None, desired_attributes=None, uploads=None):
         self.module = module
         self.entity = None
@@ -163,13 +222,15 @@ class PulpEntity(object):
     def primary_key(self):
         return {self._href: self.entity["pulp_href"]}
 
-    def find(self, failsafe=True, parameters=None):
+    def find(self, failsafe=True, parameters=None, fields=None):
         if not hasattr(self, "_list_id"):
             raise SqueezerException("This entity is not enumeratable.")
         if parameters is None:
             parameters = {}
         parameters["limit"] = 1
         parameters.update(self.natural_key)
+        if fields is not None:
+            parameters["fields"] = ",".join(sorted(fields))
         search_result = self.module.pulp_api.call(self._list_id, parameters=parameters)
         if search_result["count"] == 1:
             self.entity = search_result["results"][0]
@@ -193,19 +254,47 @@ class PulpEntity(object):
                 )
             )
 
+    def lookup(self, failsafe=False):
+        """Find the entity in order to reference it from another one.
+
+        With lookup_projection enabled, only the fields used for that are fetched.
+        """
+        fields = None
+        if (
+            self.module.params["lookup_projection"]
+            and hasattr(self, "_list_id")
+            and "fields" in self.module.pulp_api.plan(self._list_id).locations
+        ):
+            fields = set(self._lookup_fields)
+            fields.update(self.natural_key)
+            fields.update(self.desired_attributes)
+        self.find(failsafe=failsafe, fields=fields)
+
     def list(self):
         if not hasattr(self, "_list_id"):
             raise SqueezerException("This entity is not enumeratable.")
-        entities = []
-        offset = 0
-        search_result = {"next": True}
-        while search_result["next"]:
-            search_result = self.module.pulp_api.call(
-                self._list_id, parameters={"limit": PAGE_LIMIT, "offset": offset}
-            )
-            entities.extend(search_result["results"])
-            offset += PAGE_LIMIT
-        return entities
+        search_result = self.module.pulp_api.stream(
+            self._list_id, parameters={"limit": PAGE_LIMIT, "offset": 0}
+        )
+        for entity in search_result:
+            yield entity
+        if search_result.page["next"]:
+            # With the total count known, fetch the remaining pages concurrently.
+            offsets = list(range(PAGE_LIMIT, search_result.page["count"], PAGE_LIMIT))
+            for start in range(0, len(offsets), LIST_CONCURRENCY):
+                calls = [
+                    (self._list_id, {"limit": PAGE_LIMIT, "offset": offset}, None)
+                    for offset in offsets[start : start + LIST_CONCURRENCY]
+                ]
+                # Pages are only needed once, keep them out of the response cache.
+                pages = self.module.pulp_api.call_many(
+                    calls, max_workers=LIST_CONCURRENCY, cache=False
+                )
+                for page in pages:
+                    if isinstance(page, Exception):
+                        raise page
+                    for entity in page["results"]:
+                        yield entity
 
     def read(self):
         if not hasattr(self, "_read_id"):
@@ -218,7 +307,12 @@ class PulpEntity(object):
         self.entity = dict()
         self.entity.update(self.natural_key)
         self.entity.update(self.desired_attributes)
-        if not self.module.check_mode:
+        if self.module.check_mode:
+            if self.module.pulp_api.validate_requests:
+                self.module.pulp_api.validate(
+                    self._create_id, body=self.entity, uploads=self.uploads
+                )
+        else:
             response = self.module.pulp_api.call(
                 self._create_id, body=self.entity, uploads=self.uploads
             )
@@ -238,7 +332,12 @@ class PulpEntity(object):
                 changes[key] = value
         if changes:
             if hasattr(self, "_partial_update_id"):
-                if not self.module.check_mode:
+                if self.module.check_mode:
+                    if self.module.pulp_api.validate_requests:
+                        self.module.pulp_api.validate(
+                            self._partial_update_id, parameters=self.primary_key, body=changes
+                        )
+                else:
                     response = self.module.pulp_api.call(
                         self._partial_update_id,
                         parameters=self.primary_key,
@@ -250,7 +349,12 @@ class PulpEntity(object):
                     else:
                         self.entity = response
             elif hasattr(self, "_update_id"):
-                if not self.module.check_mode:
+                if self.module.check_mode:
+                    if self.module.pulp_api.validate_requests:
+                        self.module.pulp_api.validate(
+                            self._update_id, parameters=self.primary_key, body=self.entity
+                        )
+                else:
                     response = self.module.pulp_api.call(
                         self._update_id, parameters=self.primary_key, body=self.entity
                     )
@@ -315,6 +419,8 @@ class PulpEntity(object):
 
 
 class PulpRepository(PulpEntity):
+    _lookup_fields = ("pulp_href", "latest_version_href", "versions_href")
+
     def process_sync(self, remote, parameters=None):
         repository_version = self.entity["latest_version_href"]
         # In check_mode, assume nothing changed
@@ -382,8 +488,9 @@ class PulpArtifact(PulpEntity):
             self.module.set_changed()
             return self.entity
         with open(filename, "rb") as f:
-            self.uploads["file"] = f.read()
-        return super(PulpArtifact, self).create()
+            # The file is streamed to the server while it is uploaded.
+            self.uploads["file"] = f
+            return super(PulpArtifact, self).create()
 
 
 class PulpOrphans(PulpEntity):
@@ -436,7 +543,13 @@ class PulpTask(PulpEntity):
 
     def find(self):
         parameters = {"task_href": self.natural_key["pulp_href"]}
-        self.entity = self.module.pulp_api.call(self._read_id, parameters=parameters)
+        self.entity = self.module.pulp_api.call(self._read_id, parameters=parameters, cache=False)
+
+    def read(self):
+        # Tasks change on the server, never serve them from the response cache.
+        self.entity = self.module.pulp_api.call(
+            self._read_id, parameters=self.primary_key, cache=False
+        )
 
     def process_special(self):
         if self.module.params["state"] in ["canceled", "completed"]:
@@ -457,10 +570,14 @@ class PulpTask(PulpEntity):
             super(PulpTask, self).process_special()
 
     def wait_for(self, desired_state="completed"):
+        started = time()
         self.find()
         while self.entity["state"] not in ["completed", "failed", "canceled"]:
             sleep(2)
             self.read()
+        self.module.pulp_api.hooks.fire("task_wait", time() - started)
+        # Whatever the task touched is outdated now.
+        self.module.pulp_api.clear_cache()
         if self.entity["state"] != desired_state:
             if self.entity["state"] == "failed":
                 raise Exception(
@@ -480,15 +597,14 @@ class PulpUpload(PulpEntity):
     _commit_id = "uploads_commit"
 
     @classmethod
-    def chunked_upload(cls, module, path, sha256, size):
-        offset = 0
-
+    def chunked_upload(cls, module, path, sha256, size, chunk_size=CONTENT_CHUNK_SIZE):
         upload = cls(module, natural_key={}, desired_attributes={"size": size})
         upload.create()
         try:
             with open(path, "rb") as f:
-                for chunk in iter(lambda: f.read(CONTENT_CHUNK_SIZE), b""):
-                    actual_chunk_size = len(chunk)
+                # Chunks are sent straight from the file, they are never read into memory.
+                for offset in range(0, size, chunk_size):
+                    actual_chunk_size = min(chunk_size, size - offset)
                     content_range = "bytes {start}-{end}/{size}".format(
                         start=offset,
                         end=offset + actual_chunk_size - 1,
@@ -496,9 +612,8 @@ class PulpUpload(PulpEntity):
                     )
                     parameters = upload.primary_key
                     parameters["Content-Range"] = content_range
-                    uploads = {"file": chunk}
+                    uploads = {"file": FileRange(f, offset, actual_chunk_size)}
                     module.pulp_api.call(cls._update_id, parameters=parameters, uploads=uploads)
-                    offset += actual_chunk_size
 
                 response = module.pulp_api.call(
                     cls._commit_id,
@@ -6,9 +6,14 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 
+import time
 import traceback
 
 from ansible.module_utils.basic import AnsibleModule, env_fallback, missing_required_lib
+from ansible_collections.pulp.squeezer.plugins.module_utils.instrumentation import (
+    Hooks,
+    RequestStats,
+)
 
 try:
     from packaging.requirements import SpecifierSet
@@ -31,6 +36,70 @@ class SqueezerException(Exception):
     pass
 
 
+if PULP_CLI_IMPORT_ERR is None:
+
+    class SqueezerPulpContext(PulpContext):
+        """PulpContext reporting its requests and task waits to instrumentation hooks."""
+
+        def __init__(self, *args, hooks, **kwargs):
+            self.hooks = hooks
+            super().__init__(*args, **kwargs)
+
+        @property
+        def api(self):
+            if self._api is None:
+                self._instrument(super().api)
+            return self._api
+
+        def _instrument(self, api):
+            hooks = self.hooks
+            status = {}
+
+            def _count_bytes(response, *args, **kwargs):
+                if response.request.body is not None:
+                    hooks.fire("bytes_sent", len(response.request.body))
+                content = response.content
+                # Like the legacy client, count the bytes on the wire, before decompression.
+                tell = getattr(response.raw, "tell", None)
+                hooks.fire("bytes_received", tell() if tell is not None else len(content))
+                status["code"] = response.status_code
+
+            api._session.hooks["response"].append(_count_bytes)
+            call = api.call
+
+            def _call(operation_id, *args, **kwargs):
+                method = api.operations[operation_id][0]
+                hooks.fire("request_start", operation_id, method)
+                status.clear()
+                started = time.time()
+                try:
+                    return call(operation_id, *args, **kwargs)
+                finally:
+                    hooks.fire(
+                        "request_end",
+                        operation_id,
+                        method,
+                        status.get("code"),
+                        time.time() - started,
+                    )
+
+            api.call = _call
+
+        def wait_for_task(self, *args, **kwargs):
+            started = time.time()
+            try:
+                return super().wait_for_task(*args, **kwargs)
+            finally:
+                self.hooks.fire("task_wait", time.time() - started)
+
+        def wait_for_task_group(self, *args, **kwargs):
+            started = time.time()
+            try:
+                return super().wait_for_task_group(*args, **kwargs)
+            finally:
+                self.hooks.fire("task_wait", time.time() - started)
+
+
 __VERSION__ = "0.0.20-dev"
 
 
@@ -53,6 +122,11 @@ class PulpAnsibleModule(AnsibleModule):
             },
             "refresh_api_cache": {"type": "bool", "default": False},
             "timeout": {"type": "int", "default": 10},
+            "squeezer_stats": {
+                "type": "bool",
+                "default": False,
+                "fallback": (env_fallback, ["SQUEEZER_STATS"]),
+            },
         }
         argument_spec.update(kwargs.pop("argument_spec", {}))
         if not kwargs.pop("no_auth", False):
@@ -85,7 +159,13 @@ class PulpAnsibleModule(AnsibleModule):
                 password=self.params["password"],
             )
 
-        self.pulp_ctx = PulpContext(
+        self._stats = None
+        hooks = Hooks()
+        if self.params["squeezer_stats"]:
+            self._stats = RequestStats()
+            self._stats.attach(hooks)
+
+        self.pulp_ctx = SqueezerPulpContext(
             api_root="/pulp/",
             api_kwargs=dict(
                 base_url=self.params["pulp_url"],
@@ -99,6 +179,7 @@ class PulpAnsibleModule(AnsibleModule):
             background_tasks=False,
             timeout=self.params["timeout"],
             fake_mode=self.check_mode,  # This sets api_kwargs["safe_calls_only"] for us.
+            hooks=hooks,
         )
 
     def __enter__(self):
@@ -115,19 +196,36 @@ class PulpAnsibleModule(AnsibleModule):
                     "before": self._diff_states[0],
                     "after": self._diff_states[-1],
                 }
+            self._results.update(self._stats_results())
             self.exit_json(changed=self._changed, **self._results)
         else:
             if issubclass(exc_class, (PulpException, PulpNoWait, SqueezerException)):
-                self.fail_json(msg=str(exc_value), changed=self._changed)
+                self.fail_json(msg=str(exc_value), changed=self._changed, **self._stats_results())
                 return True
             elif issubclass(exc_class, Exception):
                 self.fail_json(
                     msg=str(exc_value),
                     changed=self._changed,
                     exception="\n".join(traceback.format_exception(exc_class, exc_value, tb)),
+                    **self._stats_results(),
                 )
                 return True
 
+    def _stats_results(self):
+        # Reported on failures too, that is when the timings matter most.
+        if self._stats is None:
+            return {}
+        return {"squeezer_stats": self._stats.summary()}
+
+    def projection(self, *fields):
+        """Search parameters restricting a lookup to pulp_href and fields.
+
+        Empty unless the module offers the lookup_projection option and it is enabled.
+        """
+        if self.params.get("lookup_projection"):
+            return {"fields": ",".join(("pulp_href",) + fields)}
+        return {}
+
     def set_changed(self):
         self._changed = True
 
@@ -34,6 +34,7 @@ options:
     required: false
 extends_documentation_fragment:
   - pulp.squeezer.pulp
+  - pulp.squeezer.pulp.legacy
   - pulp.squeezer.pulp.entity_state
 author:
   - Matthias Dellweg (@mdellweg)
@@ -115,7 +116,7 @@ def main():
         if content_guard_name is not None:
             if content_guard_name:
                 content_guard = PulpContentGuard(module, {"name": content_guard_name})
-                content_guard.find(failsafe=False)
+                content_guard.lookup()
                 desired_attributes["content_guard"] = content_guard.href
             else:
                 desired_attributes["content_guard"] = None
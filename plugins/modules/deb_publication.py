@@ -29,6 +29,7 @@ options:
     choices: ["structured", "simple", "simple_and_structured", "verbatim"]
 extends_documentation_fragment:
   - pulp.squeezer.pulp
+  - pulp.squeezer.pulp.legacy
   - pulp.squeezer.pulp.entity_state
 author:
   - Matthias Dellweg (@mdellweg)
@@ -111,7 +112,7 @@ def main():
 
         if repository_name:
             repository = PulpDebRepository(module, {"name": repository_name})
-            repository.find(failsafe=False)
+            repository.lookup()
             # TODO check if version exists
             if version:
                 repository_version_href = repository.entity["versions_href"] + "{version}/".format(
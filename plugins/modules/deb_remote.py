@@ -49,6 +49,7 @@ options:
 
 extends_documentation_fragment:
   - pulp.squeezer.pulp
+  - pulp.squeezer.pulp.legacy
   - pulp.squeezer.pulp.entity_state
   - pulp.squeezer.pulp.remote
 author:
@@ -21,6 +21,7 @@ options:
     type: str
 extends_documentation_fragment:
   - pulp.squeezer.pulp
+  - pulp.squeezer.pulp.legacy
   - pulp.squeezer.pulp.entity_state
 author:
   - Matthias Dellweg (@mdellweg)
@@ -30,6 +30,7 @@ options:
     default: false
 extends_documentation_fragment:
   - pulp.squeezer.pulp
+  - pulp.squeezer.pulp.legacy
 author:
   - Matthias Dellweg (@mdellweg)
 """
@@ -72,10 +73,10 @@ def main():
         },
     ) as module:
         remote = PulpDebRemote(module, {"name": module.params["remote"]})
-        remote.find(failsafe=False)
+        remote.lookup()
 
         repository = PulpDebRepository(module, {"name": module.params["repository"]})
-        repository.find(failsafe=False)
+        repository.lookup()
 
         parameters = {"mirror": module.params["mirror"]}
         repository.process_sync(remote, parameters)
@@ -59,6 +59,12 @@ options:
           - SHA256 digest of the content unit
         type: str
         required: true
+  lookup_projection:
+    description:
+      - Whether the content units are looked up with just their C(pulp_href).
+      - This uses the C(fields) parameter of the list endpoints and reduces the size of the responses.
+    type: bool
+    default: false
 extends_documentation_fragment:
   - pulp.squeezer.pulp.glue
   - pulp.squeezer.pulp
@@ -132,6 +138,7 @@ def main():
                     "sha256": {"required": True, "aliases": ["digest"]},
                 },
             },
+            "lookup_projection": {"type": "bool", "default": False},
         },
     ) as module:
         repository_name = module.params["repository"]
@@ -159,10 +166,12 @@ def main():
                 item.pop("digest", None)
                 file_content_ctx = PulpFileContentContext(
                     module.pulp_ctx,
-                    entity=item,
+                    entity={**item, **module.projection()},
                 )
                 try:
-                    file_content_ctx.find(repository_version=repository_version_href, **item)
+                    file_content_ctx.find(
+                        repository_version=repository_version_href, **item, **module.projection()
+                    )
                 except PulpException:
                     content_to_add.append(file_content_ctx.entity["pulp_href"])
 
@@ -171,7 +180,11 @@ def main():
                 item.pop("digest", None)
                 file_content_ctx = PulpFileContentContext(
                     module.pulp_ctx,
-                    entity={"repository_version": repository_version_href, **item},
+                    entity={
+                        "repository_version": repository_version_href,
+                        **item,
+                        **module.projection(),
+                    },
                 )
                 try:
                     content_to_remove.append(file_content_ctx.entity["pulp_href"])
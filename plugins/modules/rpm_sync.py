@@ -47,6 +47,7 @@ options:
 
 extends_documentation_fragment:
   - pulp.squeezer.pulp
+  - pulp.squeezer.pulp.legacy
 author:
   - Jacob Floyd (@cognifloyd)
 """
@@ -101,16 +102,14 @@ def main():
         },
     ) as module:
         remote = PulpRpmRemote(module, {"name": module.params["remote"]})
-        remote.find(failsafe=False)
+        remote.lookup()
 
         repository = PulpRpmRepository(module, {"name": module.params["repository"]})
-        repository.find(failsafe=False)
+        repository.lookup()
 
         # pulp_rpm supports sync_policy from 3.16.
         # Earlier versions support only mirror.
-        rpm_version = (
-            module.pulp_api.api_spec.get("info", {}).get("x-pulp-app-versions", {}).get("rpm", ())
-        )
+        rpm_version = module.pulp_api.info.get("x-pulp-app-versions", {}).get("rpm", ())
         if pulp_parse_version(rpm_version) >= pulp_parse_version("3.16.0"):
             parameters = {"sync_policy": module.params["sync_policy"]}
         elif module.params["sync_policy"] == "mirror_content_only":
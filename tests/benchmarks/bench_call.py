@@ -0,0 +1,84 @@
+"""Client side overhead of api calls.
+
+bind:   binding parameters to the path, query and headers of an operation.
+render: rendering a json body and a multipart upload of one chunk.
+call:   a complete list call against a local stub server, with and without the response cache.
+
+Run with the collection importable, e.g. `make benchmark`.
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+
+from ansible_collections.pulp.squeezer.plugins.module_utils.openapi import OpenAPI
+from harness import (
+    DOC_PATH,
+    StubServer,
+    emit,
+    emit_environment,
+    measure,
+    recorded_response,
+    recorded_spec,
+)
+
+CASSETTE = "deb_repository-2.yml"
+LIST_PATH = "/pulp/api/v3/repositories/deb/apt/"
+LIST_PARAMETERS = {"name": "test_deb_repository", "limit": 1, "offset": 0}
+CHUNK_SIZE = 1024 * 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=1000)
+    args = parser.parse_args()
+    emit_environment("call")
+
+    cache_home = tempfile.mkdtemp(prefix="squeezer-bench-")
+    os.environ["XDG_CACHE_HOME"] = cache_home
+    routes = {
+        DOC_PATH: recorded_spec(),
+        LIST_PATH: recorded_response(CASSETTE, LIST_PATH),
+    }
+    try:
+        with StubServer(routes) as server:
+            api = OpenAPI(server.base_url, DOC_PATH)
+            run(api, args.repeat)
+    finally:
+        shutil.rmtree(cache_home)
+
+
+def run(api, repeat):
+    list_plan = api.plan("repositories_deb_apt_list")
+    emit("call", "bind", **measure(lambda: list_plan.bind(LIST_PARAMETERS), repeat))
+
+    create_plan = api.plan("repositories_deb_apt_create")
+    body = {"name": "test_deb_repository", "description": "A repository", "retain_repo_versions": 3}
+    emit(
+        "call",
+        "render",
+        body="json",
+        **measure(lambda: api.render_body(create_plan, {}, body=body), repeat)
+    )
+
+    upload_plan = api.plan("uploads_update")
+    chunk = os.urandom(CHUNK_SIZE)
+    emit(
+        "call",
+        "render",
+        body="multipart",
+        size_bytes=CHUNK_SIZE,
+        **measure(lambda: api.render_body(upload_plan, {}, uploads={"file": chunk}), repeat)
+    )
+
+    def call(cache):
+        api.call("repositories_deb_apt_list", parameters=LIST_PARAMETERS, cache=cache)
+
+    call(True)
+    emit("call", "call", cache=False, **measure(lambda: call(False), repeat))
+    emit("call", "call", cache=True, **measure(lambda: call(True), repeat))
+
+
+if __name__ == "__main__":
+    main()
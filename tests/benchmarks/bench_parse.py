@@ -0,0 +1,50 @@
+"""Time to parse and compile api specs of different sizes.
+
+small:  a server with only the core and file plugins.
+medium: a server with most plugins installed.
+large:  a server with all plugins of the recordings installed.
+
+Run with the collection importable, e.g. `make benchmark`.
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+
+from ansible_collections.pulp.squeezer.plugins.module_utils.openapi import OpenAPI
+from harness import DOC_PATH, StubServer, emit, emit_environment, measure, recorded_spec
+
+SPECS = {
+    "small": "status-0.yml",
+    "medium": "deb_distribution-0.yml",
+    "large": "container_sync-0.yml",
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    emit_environment("parse")
+
+    cache_home = tempfile.mkdtemp(prefix="squeezer-bench-")
+    os.environ["XDG_CACHE_HOME"] = cache_home
+    try:
+        for size, cassette in SPECS.items():
+            data = recorded_spec(cassette)
+            with StubServer({DOC_PATH: data}) as server:
+                api = OpenAPI(server.base_url, DOC_PATH)
+            emit(
+                "parse",
+                size,
+                size_bytes=len(data),
+                operations=len(api.operations),
+                **measure(lambda: api._parse_api(data), args.repeat)
+            )
+    finally:
+        shutil.rmtree(cache_home)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Startup time of the OpenAPI client for the api spec cache formats.
+
+cold:    empty cache, the spec is downloaded, parsed and written to the cache.
+reparse: the cached spec is parsed again, because the precompiled cache is missing.
+warm:    the precompiled cache is used.
+
+Run with the collection importable, e.g. `make benchmark`.
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+
+from ansible_collections.pulp.squeezer.plugins.module_utils.openapi import HAS_ZSTD, OpenAPI
+from harness import DOC_PATH, StubServer, emit, emit_environment, measure, recorded_spec
+
+COMPRESSIONS = ["none", "gzip"] + (["zstd"] if HAS_ZSTD else [])
+MODES = ["full", "slim"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    emit_environment("spec_cache")
+
+    cache_home = tempfile.mkdtemp(prefix="squeezer-bench-")
+    os.environ["XDG_CACHE_HOME"] = cache_home
+    try:
+        with StubServer({DOC_PATH: recorded_spec()}) as server:
+            for compression in COMPRESSIONS:
+                for mode in MODES:
+                    run(server, compression, mode, args.repeat, cache_home)
+    finally:
+        shutil.rmtree(cache_home)
+
+
+def run(server, compression, mode, repeat, cache_home):
+    def client():
+        return OpenAPI(server.base_url, DOC_PATH, cache_mode=mode, cache_compression=compression)
+
+    def clear_cache():
+        shutil.rmtree(os.path.join(cache_home, "squeezer"), ignore_errors=True)
+
+    def drop_compiled():
+        try:
+            os.remove(client_cache + ".compiled")
+        except OSError:
+            pass
+
+    case = "{}-{}".format(compression, mode)
+    emit("spec_cache", case, phase="cold", **measure(client, repeat, setup=clear_cache))
+    client_cache = client()._apidoc_cache
+    emit(
+        "spec_cache",
+        case,
+        phase="reparse",
+        size_bytes=os.path.getsize(client_cache),
+        **measure(client, repeat, setup=drop_compiled)
+    )
+    emit("spec_cache", case, phase="warm", **measure(client, repeat))
+
+
+if __name__ == "__main__":
+    main()
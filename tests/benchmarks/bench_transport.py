@@ -0,0 +1,85 @@
+"""Latency of typical api calls over the transports the OpenAPI client supports.
+
+tls:  https on a local tcp port.
+tcp:  plain http on a local tcp port.
+unix: plain http on a unix socket, as used when running on the Pulp host itself.
+
+Every transport is measured with pooled keep-alive connections and with a fresh connection per
+call. "find" is a filtered list call, "read" fetches a single entity. The tls transport is left
+out if the openssl command is not available to create a certificate.
+
+Run with the collection importable, e.g. `make benchmark`.
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+
+from ansible_collections.pulp.squeezer.plugins.module_utils.openapi import OpenAPI
+from harness import (
+    DOC_PATH,
+    StubServer,
+    emit,
+    emit_environment,
+    measure,
+    recorded_response,
+    recorded_spec,
+    self_signed_context,
+)
+
+CASSETTE = "deb_repository-2.yml"
+LIST_PATH = "/pulp/api/v3/repositories/deb/apt/"
+READ_PATH = "/pulp/api/v3/repositories/deb/apt/be632b3f-140b-4405-803f-3d4cf1d142df/"
+CALLS = {
+    "find": (
+        "repositories_deb_apt_list",
+        {"name": "test_deb_repository", "limit": 1},
+    ),
+    "read": ("repositories_deb_apt_read", {"deb_apt_repository_href": READ_PATH}),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    emit_environment("transport")
+
+    tmpdir = tempfile.mkdtemp(prefix="squeezer-bench-")
+    os.environ["XDG_CACHE_HOME"] = os.path.join(tmpdir, "cache")
+    routes = {
+        DOC_PATH: recorded_spec(),
+        LIST_PATH: recorded_response(CASSETTE, LIST_PATH),
+        READ_PATH: recorded_response(CASSETTE, READ_PATH),
+    }
+    transports = {
+        "tls": {"ssl_context": self_signed_context(tmpdir)},
+        "tcp": {},
+        "unix": {"unix_socket": os.path.join(tmpdir, "api.sock")},
+    }
+    try:
+        for transport, server_kwargs in transports.items():
+            if "ssl_context" in server_kwargs and server_kwargs["ssl_context"] is None:
+                emit("transport", transport, skipped="openssl is not available")
+                continue
+            with StubServer(routes, **server_kwargs) as server:
+                run(server, transport, args.repeat)
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+def run(server, transport, repeat):
+    for reuse, pool_size in (("pooled", 10), ("fresh", 0)):
+        api = OpenAPI(server.base_url, DOC_PATH, validate_certs=False, pool_size=pool_size)
+        for name, (operation_id, parameters) in CALLS.items():
+
+            def call():
+                api.call(operation_id, parameters=parameters, cache=False)
+
+            call()
+            emit("transport", "{}-{}".format(transport, reuse), call=name, **measure(call, repeat))
+
+
+if __name__ == "__main__":
+    main()
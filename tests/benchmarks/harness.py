@@ -0,0 +1,183 @@
+"""Helpers shared by the benchmarks.
+
+The benchmarks run offline: Pulp is replaced by a local http server answering with payloads
+taken from the recorded test fixtures. Every measurement is written to stdout as one json
+object per line. Each benchmark starts with an "environment" record naming the python version,
+platform and git revision, so results collected over time can be compared.
+"""
+
+import json
+import os
+import platform
+import socketserver
+import ssl
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import yaml
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "fixtures")
+SPEC_CASSETTE = "deb_distribution-0.yml"
+DOC_PATH = "/pulp/api/v3/docs/api.json"
+
+
+def recorded_spec(cassette=SPEC_CASSETTE):
+    """Return the api spec recorded in a cassette as bytes."""
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(os.path.join(FIXTURES_DIR, cassette)) as f:
+        recording = yaml.load(f, Loader=loader)
+    for interaction in recording["interactions"]:
+        if interaction["request"]["uri"].endswith(DOC_PATH):
+            return interaction["response"]["body"]["string"].encode()
+    raise LookupError("No api spec recorded in {}.".format(cassette))
+
+
+def recorded_response(cassette, path):
+    """Return the body of the first successful GET of `path` recorded in a cassette."""
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(os.path.join(FIXTURES_DIR, cassette)) as f:
+        recording = yaml.load(f, Loader=loader)
+    for interaction in recording["interactions"]:
+        request = interaction["request"]
+        response = interaction["response"]
+        if (
+            request["method"] == "GET"
+            and urlsplit(request["uri"]).path == path
+            and response["status"]["code"] == 200
+        ):
+            return response["body"]["string"].encode()
+    raise LookupError("No response for {} recorded in {}.".format(path, cassette))
+
+
+def self_signed_context(directory):
+    """Create a server ssl context with a fresh self-signed certificate for localhost.
+
+    Returns None if the openssl command is not available.
+    """
+    cert = os.path.join(directory, "cert.pem")
+    key = os.path.join(directory, "key.pem")
+    try:
+        subprocess.run(
+            ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1"]
+            + ["-subj", "/CN=localhost", "-keyout", key, "-out", cert],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    return context
+
+
+class StubServer:
+    """Serve fixed payloads by path on localhost and count the requests.
+
+    By default the server listens on a tcp port. With `unix_socket` it listens on that socket
+    instead, with `ssl_context` it speaks https.
+    """
+
+    def __init__(self, routes, unix_socket=None, ssl_context=None):
+        self.routes = routes
+        self.requests = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately, avoid a delayed ack stall between them.
+            disable_nagle_algorithm = unix_socket is None
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                server.requests += 1
+                body = server.routes.get(self.path.split("?", 1)[0])
+                if body is None:
+                    self.send_response(404)
+                    body = b"{}"
+                else:
+                    self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        if unix_socket is not None:
+            self._httpd = socketserver.ThreadingUnixStreamServer(unix_socket, Handler)
+            self._httpd.daemon_threads = True
+            self.base_url = "unix:" + unix_socket
+        else:
+            self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+            scheme = "http"
+            if ssl_context is not None:
+                self._httpd.socket = ssl_context.wrap_socket(self._httpd.socket, server_side=True)
+                scheme = "https"
+            self.base_url = "{}://127.0.0.1:{}/".format(scheme, self._httpd.server_address[1])
+
+    def __enter__(self):
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+def measure(func, repeat, setup=None):
+    """Time `func` `repeat` times, running `setup` untimed before each run.
+
+    Returns the minimum, median and maximum in milliseconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return {
+        "min_ms": round(timings[0], 3),
+        "median_ms": round(timings[len(timings) // 2], 3),
+        "max_ms": round(timings[-1], 3),
+    }
+
+
+def emit_environment(benchmark):
+    """Write the environment record for a benchmark."""
+    try:
+        revision = (
+            subprocess.run(
+                ["git", "rev-parse", "HEAD"],
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+                check=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+            .stdout.decode()
+            .strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        revision = None
+    emit(
+        benchmark,
+        "environment",
+        python=platform.python_version(),
+        platform=platform.platform(),
+        revision=revision,
+        timestamp=round(time.time()),
+    )
+
+
+def emit(benchmark, case, **values):
+    """Write one measurement as a json line."""
+    record = {"benchmark": benchmark, "case": case}
+    record.update(values)
+    sys.stdout.write(json.dumps(record, sort_keys=True) + "\n")
+    sys.stdout.flush()
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Import the collection as built by `make test`.
+COLLECTIONS_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "build", "collections")
+if os.path.isdir(COLLECTIONS_PATH):
+    sys.path.insert(0, os.path.abspath(COLLECTIONS_PATH))
@@ -0,0 +1,65 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answer with what the server's `routes` say for the requested path.
+
+    A route is a (status, headers, body) tuple, or a list of them to be answered in turn, the
+    last one repeatedly. Every request is recorded in `server.requests`. Answers to paths in
+    `server.holds` are delayed until the event stored there is set.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        self.server.requests.append((self.command, self.path, dict(self.headers), body))
+        hold = self.server.holds.get(self.path)
+        if hold is not None:
+            hold.wait(10)
+        route = self.server.routes.get(self.path, (404, {}, b"{}"))
+        if isinstance(route, list):
+            route = route.pop(0) if len(route) > 1 else route[0]
+        status, headers, response_body = route
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(response_body)))
+        self.end_headers()
+        self.wfile.write(response_body)
+        if self.server.drop_connections:
+            # Close the connection without announcing it, like an idle timeout would.
+            self.close_connection = True
+
+    do_GET = do_HEAD = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    httpd.daemon_threads = True
+    httpd.routes = {}
+    httpd.requests = []
+    httpd.holds = {}
+    httpd.drop_connections = False
+    httpd.base_url = "http://127.0.0.1:{0}".format(httpd.server_address[1])
+    thread = threading.Thread(target=httpd.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    """Keep the api spec cache of the clients under test out of the home directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    return tmp_path
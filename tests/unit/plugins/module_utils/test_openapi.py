@@ -0,0 +1,889 @@
+import hashlib
+import io
+import json
+import socket
+import threading
+import time
+from email.utils import formatdate
+
+import pytest
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible.module_utils.six.moves.urllib.parse import urlencode
+from ansible_collections.pulp.squeezer.plugins.module_utils.openapi import (
+    CallPlan,
+    ConnectionPool,
+    FileRange,
+    MultipartBody,
+    OpenAPI,
+    ResultsStream,
+    SpilledResults,
+    compile_api,
+    load_spilled,
+    parse_retry_after,
+    read_response,
+    slim_api_spec,
+)
+from ansible_collections.pulp.squeezer.plugins.module_utils.validation import (
+    ValidationError,
+    request_schemas,
+)
+
+
+def test_follows_redirect(server):
+    server.routes["/old/"] = (301, {"Location": "/new/"}, b"")
+    server.routes["/new/"] = (200, {}, b'{"ok": true}')
+    pool = ConnectionPool()
+
+    response = pool.urlopen("GET", server.base_url + "/old/")
+
+    assert response.status == 200
+    assert json.loads(response.read()) == {"ok": True}
+    assert [request[1] for request in server.requests] == ["/old/", "/new/"]
+
+
+def test_redirect_keeps_method_and_body_for_307(server):
+    server.routes["/old/"] = (307, {"Location": "/new/"}, b"")
+    server.routes["/new/"] = (201, {}, b"{}")
+    pool = ConnectionPool()
+
+    response = pool.urlopen(
+        "POST", server.base_url + "/old/", data=b'{"a": 1}', headers={"Content-Length": "8"}
+    )
+
+    assert response.status == 201
+    assert [(request[0], request[3]) for request in server.requests] == [
+        ("POST", b'{"a": 1}'),
+        ("POST", b'{"a": 1}'),
+    ]
+
+
+def test_redirect_after_post_becomes_get(server):
+    server.routes["/old/"] = (303, {"Location": "/new/"}, b"")
+    server.routes["/new/"] = (200, {}, b"{}")
+    pool = ConnectionPool()
+
+    pool.urlopen(
+        "POST",
+        server.base_url + "/old/",
+        data=b"{}",
+        headers={"Content-Type": "application/json", "Content-Length": "2"},
+    ).read()
+
+    method, path, headers, body = server.requests[1]
+    assert (method, path, body) == ("GET", "/new/", b"")
+    assert "Content-Type" not in headers
+
+
+def test_redirect_to_other_host_drops_authorization(server):
+    other_url = server.base_url.replace("127.0.0.1", "localhost")
+    server.routes["/old/"] = (302, {"Location": other_url + "/new/"}, b"")
+    server.routes["/same/"] = (302, {"Location": "/new/"}, b"")
+    server.routes["/new/"] = (200, {}, b"{}")
+    pool = ConnectionPool()
+
+    pool.urlopen("GET", server.base_url + "/same/", headers={"Authorization": "Basic x"}).read()
+    pool.urlopen("GET", server.base_url + "/old/", headers={"Authorization": "Basic x"}).read()
+
+    assert [request[2].get("Authorization") for request in server.requests] == [
+        "Basic x",
+        "Basic x",
+        "Basic x",
+        None,
+    ]
+
+
+def test_redirect_loop_raises(server):
+    server.routes["/loop/"] = (302, {"Location": "/loop/"}, b"")
+    pool = ConnectionPool()
+
+    with pytest.raises(HTTPError) as excinfo:
+        pool.urlopen("GET", server.base_url + "/loop/")
+    assert excinfo.value.code == 302
+
+
+def test_error_status_raises(server):
+    server.routes["/missing/"] = (404, {}, b'{"detail": "Not found."}')
+    pool = ConnectionPool()
+
+    with pytest.raises(HTTPError) as excinfo:
+        pool.urlopen("GET", server.base_url + "/missing/")
+    assert excinfo.value.code == 404
+    assert json.loads(excinfo.value.read()) == {"detail": "Not found."}
+
+
+def test_reuses_connections(server):
+    server.routes["/a/"] = (200, {}, b"{}")
+    pool = ConnectionPool()
+
+    for _ in range(3):
+        pool.urlopen("GET", server.base_url + "/a/").read()
+
+    assert pool.stats["new"] == 1
+    assert pool.stats["reused"] == 2
+
+
+def test_reconnects_stale_connection(server):
+    server.routes["/a/"] = (200, {}, b"{}")
+    server.drop_connections = True
+    pool = ConnectionPool()
+
+    for _ in range(3):
+        assert pool.urlopen("GET", server.base_url + "/a/").read() == b"{}"
+
+    assert len(server.requests) == 3
+    assert pool.stats["new"] == 3
+
+
+@pytest.mark.parametrize("max_workers", [0, -1])
+def test_call_many_needs_a_worker(max_workers):
+    api = OpenAPI.__new__(OpenAPI)
+
+    with pytest.raises(ValueError):
+        api.call_many([("things_list", {}, None)], max_workers=max_workers)
+
+
+THINGS_SPEC = {
+    "openapi": "3.0.3",
+    "paths": {
+        "/things/": {
+            "get": {
+                "operationId": "things_list",
+                "parameters": [{"name": "limit", "in": "query"}, {"name": "offset", "in": "query"}],
+            },
+            "post": {
+                "operationId": "things_create",
+                "requestBody": {"content": {"application/json": {}}},
+            },
+        },
+        "{thing_href}": {
+            "parameters": [{"name": "thing_href", "in": "path", "required": True}],
+            "get": {"operationId": "things_read"},
+            "patch": {
+                "operationId": "things_partial_update",
+                "requestBody": {"content": {"application/json": {}}},
+            },
+            "delete": {"operationId": "things_delete"},
+        },
+        "/others/": {"get": {"operationId": "others_list"}},
+        "{task_href}": {
+            "parameters": [{"name": "task_href", "in": "path", "required": True}],
+            "get": {"operationId": "tasks_read"},
+        },
+    },
+}
+
+
+def serve_things(server, **kwargs):
+    """Serve THINGS_SPEC and return a client for it."""
+    server.routes["/docs/api.json"] = (200, {}, json.dumps(THINGS_SPEC).encode())
+    for path in ("/things/", "/things/?limit=1", "/things/?offset=0", "/things/?offset=20"):
+        server.routes[path] = (200, {}, b'{"count": 1, "next": null, "results": [{}]}')
+    server.routes["/things/1/"] = (200, {}, b'{"name": "one"}')
+    server.routes["/others/"] = (200, {}, b'{"count": 0, "next": null, "results": []}')
+    api = OpenAPI(server.base_url + "/", "docs/api.json", **kwargs)
+    del server.requests[:]
+    return api
+
+
+def requested(server):
+    return [(request[0], request[1]) for request in server.requests]
+
+
+def test_get_responses_are_memoized(server):
+    api = serve_things(server)
+
+    assert api.call("things_read", {"thing_href": "/things/1/"}) == {"name": "one"}
+    assert api.call("things_read", {"thing_href": "/things/1/"}) == {"name": "one"}
+
+    assert requested(server) == [("GET", "/things/1/")]
+    assert api.request_stats["requests"] == 1
+    assert api.request_stats["cache_hits"] == 1
+
+
+def test_cache_false_asks_the_server(server):
+    api = serve_things(server)
+
+    api.call("things_read", {"thing_href": "/things/1/"}, cache=False)
+    api.call("things_read", {"thing_href": "/things/1/"}, cache=False)
+    api.call("things_read", {"thing_href": "/things/1/"})
+
+    assert requested(server) == [("GET", "/things/1/")] * 3
+    assert api.request_stats["cache_hits"] == 0
+
+
+@pytest.mark.parametrize(
+    "operation_id,parameters,body,write",
+    [
+        ("things_partial_update", {"thing_href": "/things/1/"}, {"a": 1}, ("PATCH", "/things/1/")),
+        ("things_delete", {"thing_href": "/things/1/"}, None, ("DELETE", "/things/1/")),
+        ("things_create", {}, {"a": 1}, ("POST", "/things/")),
+    ],
+)
+def test_writes_invalidate_ancestors_and_descendants(server, operation_id, parameters, body, write):
+    api = serve_things(server)
+    reads = [
+        ("things_list", {"limit": 1}),
+        ("things_read", {"thing_href": "/things/1/"}),
+        ("others_list", {}),
+    ]
+    for read in reads:
+        api.call(*read)
+
+    api.call(operation_id, parameters, body)
+    for read in reads:
+        api.call(*read)
+
+    # Writing to a thing or to the collection drops both, but not the unrelated list.
+    assert requested(server) == [
+        ("GET", "/things/?limit=1"),
+        ("GET", "/things/1/"),
+        ("GET", "/others/"),
+        write,
+        ("GET", "/things/?limit=1"),
+        ("GET", "/things/1/"),
+    ]
+
+
+def test_clear_cache(server):
+    api = serve_things(server)
+    api.call("things_read", {"thing_href": "/things/1/"})
+
+    api.clear_cache()
+    api.call("things_read", {"thing_href": "/things/1/"})
+
+    assert requested(server) == [("GET", "/things/1/")] * 2
+
+
+def test_call_many_without_cache(server):
+    api = serve_things(server)
+    calls = [("things_list", {"offset": offset}, None) for offset in (0, 20)]
+
+    api.call_many(calls, max_workers=2, cache=False)
+    api.call_many(calls, max_workers=2, cache=False)
+
+    assert len(server.requests) == 4
+    assert api.request_stats["cache_hits"] == 0
+
+
+def serve_pages(server, count=5, page_size=2):
+    """Serve `count` things in pages, linking to the next page by a foreign public url."""
+    paths = ["/things/?limit={0}".format(page_size)]
+    for offset in range(page_size, count, page_size):
+        paths.append("/things/?limit={0}&offset={1}".format(page_size, offset))
+    for index, path in enumerate(paths):
+        offset = index * page_size
+        page = {
+            "count": count,
+            "next": (
+                "https://public.example.org" + paths[index + 1] if index + 1 < len(paths) else None
+            ),
+            "results": [{"index": item} for item in range(offset, min(offset + page_size, count))],
+        }
+        server.routes[path] = (200, {}, json.dumps(page).encode())
+    return paths
+
+
+def test_iterate_follows_next_by_path_and_query(server):
+    api = serve_things(server)
+    paths = serve_pages(server)
+
+    items = list(api.iterate("things_list", page_size=2))
+
+    assert [item["index"] for item in items] == list(range(5))
+    assert requested(server) == [("GET", path) for path in paths]
+
+
+@pytest.mark.parametrize("spill_threshold", [None, 10])
+def test_iterate_with_and_without_prefetch(server, spill_threshold):
+    api = serve_things(server, spill_threshold=spill_threshold)
+    serve_pages(server, count=7, page_size=3)
+
+    prefetched = list(api.iterate("things_list", page_size=3))
+    fetched = list(api.iterate("things_list", page_size=3, prefetch=False))
+
+    assert prefetched == fetched == [{"index": index} for index in range(7)]
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iterate_raises_errors_of_later_pages(server, prefetch):
+    api = serve_things(server)
+    paths = serve_pages(server)
+    server.routes[paths[1]] = (500, {}, b"Broken.")
+    items = api.iterate("things_list", page_size=2, prefetch=prefetch)
+
+    assert [next(items), next(items)] == [{"index": 0}, {"index": 1}]
+    with pytest.raises(HTTPError) as excinfo:
+        next(items)
+    assert excinfo.value.code == 500
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iterate_can_be_closed_early(server, prefetch):
+    api = serve_things(server)
+    paths = serve_pages(server)
+    items = api.iterate("things_list", page_size=2, prefetch=prefetch)
+
+    assert next(items) == {"index": 0}
+    items.close()
+
+    with pytest.raises(StopIteration):
+        next(items)
+    # Nothing beyond the prefetched page is requested and the client remains usable.
+    assert api.call("things_read", {"thing_href": "/things/1/"}) == {"name": "one"}
+    expected = paths[:2] if prefetch else paths[:1]
+    assert requested(server) == [("GET", path) for path in expected + ["/things/1/"]]
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record the delays the client waits for, advancing the clock instead of sleeping."""
+    delays = []
+    real_time = time.time
+    monkeypatch.setattr(time, "time", lambda: real_time() + sum(delays))
+    monkeypatch.setattr(time, "sleep", delays.append)
+    return delays
+
+
+def unavailable(retry_after):
+    return (503, {"Retry-After": retry_after}, b"{}")
+
+
+def test_parse_retry_after():
+    now = time.time()
+
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after(formatdate(now + 30, usegmt=True), now=now) == pytest.approx(30, 1)
+    assert parse_retry_after(formatdate(now - 30, usegmt=True), now=now) == 0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_retry_after_seconds(server, sleeps):
+    api = serve_things(server, max_retries=3)
+    server.routes["/things/1/"] = [unavailable("2"), unavailable("1"), (200, {}, b'{"a": 1}')]
+
+    assert api.call("things_read", {"thing_href": "/things/1/"}) == {"a": 1}
+
+    assert sleeps == [2, 1]
+    assert len(server.requests) == 3
+    assert api.request_stats == {"requests": 3, "cache_hits": 0, "retries": 2, "retry_delay": 3}
+
+
+def test_retry_after_http_date(server, sleeps):
+    api = serve_things(server, max_retries=3)
+    retry_at = formatdate(time.time() + 20, usegmt=True)
+    server.routes["/things/1/"] = [unavailable(retry_at), (200, {}, b"{}")]
+
+    api.call("things_read", {"thing_href": "/things/1/"})
+
+    assert len(sleeps) == 1
+    assert 15 < sleeps[0] <= 20
+
+
+def test_retries_give_up_when_exhausted(server, sleeps):
+    api = serve_things(server, max_retries=2)
+    server.routes["/things/1/"] = (429, {}, b"{}")
+
+    with pytest.raises(HTTPError) as excinfo:
+        api.call("things_read", {"thing_href": "/things/1/"})
+
+    assert excinfo.value.code == 429
+    assert len(server.requests) == 3
+    # Without Retry-After, the delays back off exponentially with full jitter.
+    assert 0 <= sleeps[0] <= 0.5 and 0 <= sleeps[1] <= 1
+    assert api.request_stats["retries"] == 2
+    assert api.request_stats["retry_delay"] == pytest.approx(sum(sleeps))
+
+
+def test_retries_stay_within_the_budget(server, sleeps):
+    api = serve_things(server, max_retries=3, retry_budget=10)
+    server.routes["/things/1/"] = [unavailable("5"), unavailable("6"), (200, {}, b"{}")]
+
+    with pytest.raises(HTTPError):
+        api.call("things_read", {"thing_href": "/things/1/"})
+
+    # Waiting another 6 seconds would exceed the budget of 10 seconds.
+    assert sleeps == [5]
+    assert len(server.requests) == 2
+    assert api.request_stats["retries"] == 1
+
+
+@pytest.mark.parametrize("retry_methods,requests", [(None, 1), (["GET", "POST"], 2)])
+def test_post_is_only_retried_if_allowed(server, sleeps, retry_methods, requests):
+    api = serve_things(server, max_retries=3, retry_methods=retry_methods)
+    server.routes["/things/"] = [unavailable("0"), (201, {}, b"{}")]
+
+    if requests == 1:
+        with pytest.raises(HTTPError):
+            api.call("things_create", body={"a": 1})
+    else:
+        api.call("things_create", body={"a": 1})
+
+    assert [request[0] for request in server.requests] == ["POST"] * requests
+    assert api.request_stats["retries"] == requests - 1
+
+
+VALIDATION_SPEC = {
+    "openapi": "3.0.3",
+    "paths": {
+        "/things/": {
+            "post": {
+                "operationId": "things_create",
+                "parameters": [{"name": "limit", "in": "query", "schema": {"type": "integer"}}],
+                "requestBody": {
+                    "content": {
+                        "application/json": {"schema": {"$ref": "#/components/schemas/Thing"}}
+                    }
+                },
+            }
+        }
+    },
+    "components": {
+        "schemas": {
+            "Thing": {
+                "type": "object",
+                "required": ["name"],
+                "properties": {"name": {"type": "string", "description": "Not needed."}},
+            }
+        }
+    },
+}
+
+
+def test_compiled_api_has_no_schemas():
+    operation = compile_api(VALIDATION_SPEC)["operations"]["things_create"]
+
+    assert "schema" not in repr(operation)
+    assert compile_api(slim_api_spec(VALIDATION_SPEC)) == compile_api(VALIDATION_SPEC)
+    assert "Thing" not in json.dumps(slim_api_spec(VALIDATION_SPEC))
+
+
+def test_validate_with_request_schemas():
+    plan = CallPlan("things_create", compile_api(VALIDATION_SPEC)["operations"]["things_create"])
+    plan.parameter_schemas, plan.body_schema = request_schemas(
+        VALIDATION_SPEC, plan.path, plan.method
+    )
+
+    plan.validate({"limit": 1}, {"name": "thing"})
+    with pytest.raises(ValidationError) as excinfo:
+        plan.validate({"limit": "1"}, {})
+    assert str(excinfo.value) == (
+        "Invalid request for things_create: query.limit must be of type integer; "
+        "body.name is required"
+    )
+
+
+@pytest.mark.parametrize("cache_mode", ["full", "slim"])
+def test_request_schemas_are_cached_with_the_spec(server, cache_home, cache_mode):
+    server.routes["/docs/api.json"] = (200, {}, json.dumps(VALIDATION_SPEC).encode())
+
+    for _ in range(2):
+        del server.requests[:]
+        api = OpenAPI(
+            server.base_url + "/", "docs/api.json", cache_mode=cache_mode, validate_requests=True
+        )
+        with pytest.raises(ValidationError):
+            api.call("things_create", {"limit": 1}, {})
+        assert not [request for request in server.requests if request[1] != "/docs/api.json"]
+
+    # The second client neither downloads nor parses the full spec.
+    assert server.requests == []
+    assert api._api_spec is None
+    assert len(list(cache_home.glob("squeezer/specs/*/api.schemas"))) == 1
+
+
+def pulp_spec(versions, api_prefix="/pulp/api/v3/"):
+    return {
+        "openapi": "3.0.3",
+        "info": {"x-pulp-app-versions": versions},
+        "paths": {
+            api_prefix + "status/": {"get": {"operationId": "status_read"}},
+            api_prefix + "things/": {"get": {"operationId": "things_list"}},
+        },
+    }
+
+
+def serve_pulp(server, spec, versions, domain_enabled=False, api_prefix="/pulp/api/v3/"):
+    status = {
+        "versions": [{"component": key, "version": value} for key, value in versions.items()],
+        "domain_enabled": domain_enabled,
+    }
+    server.routes[api_prefix + "docs/api.json"] = (200, {}, json.dumps(spec).encode())
+    server.routes[api_prefix + "status/"] = (200, {}, json.dumps(status).encode())
+
+
+def downloads(server):
+    return [request[1] for request in server.requests if request[1].endswith("api.json")]
+
+
+def test_spec_is_shared_between_servers_with_the_same_versions(server):
+    versions = {"core": "3.50.0", "file": "3.50.0"}
+    serve_pulp(server, pulp_spec(versions), versions)
+
+    OpenAPI(server.base_url + "/", "pulp/api/v3/docs/api.json")
+    api = OpenAPI(
+        server.base_url.replace("127.0.0.1", "localhost") + "/", "pulp/api/v3/docs/api.json"
+    )
+
+    assert downloads(server) == ["/pulp/api/v3/docs/api.json"]
+    assert "things_list" in api.operations
+
+
+def test_spec_is_not_shared_with_domains_enabled(server):
+    versions = {"core": "3.50.0", "file": "3.50.0"}
+    serve_pulp(server, pulp_spec(versions), versions)
+    OpenAPI(server.base_url + "/", "pulp/api/v3/docs/api.json")
+
+    serve_pulp(server, pulp_spec(versions, "/pulp/{pulp_domain}/api/v3/"), versions, True)
+    OpenAPI(server.base_url.replace("127.0.0.1", "localhost") + "/", "pulp/api/v3/docs/api.json")
+
+    assert downloads(server) == ["/pulp/api/v3/docs/api.json"] * 2
+
+
+def test_spec_is_not_shared_across_api_roots(server):
+    versions = {"core": "3.50.0", "file": "3.50.0"}
+    serve_pulp(server, pulp_spec(versions), versions)
+    serve_pulp(server, pulp_spec(versions, "/other/api/v3/"), versions, api_prefix="/other/api/v3/")
+
+    OpenAPI(server.base_url + "/", "pulp/api/v3/docs/api.json")
+    api = OpenAPI(
+        server.base_url.replace("127.0.0.1", "localhost") + "/", "other/api/v3/docs/api.json"
+    )
+
+    assert downloads(server) == ["/pulp/api/v3/docs/api.json", "/other/api/v3/docs/api.json"]
+    assert api.operations["things_list"]["path"] == "/other/api/v3/things/"
+
+
+def cached_specs(cache_home):
+    """Return the hashes of the cached specs and those listed in the versions index."""
+    specs_dir = cache_home / "squeezer" / "specs"
+    index = sorted(path.read_text() for path in (specs_dir / "versions").iterdir())
+    return sorted(path.name for path in specs_dir.iterdir() if path.name != "versions"), index
+
+
+def test_outdated_spec_is_removed(server, cache_home):
+    old_versions, new_versions = {"core": "3.50.0"}, {"core": "3.51.0"}
+    serve_pulp(server, pulp_spec(old_versions), old_versions)
+    OpenAPI(server.base_url + "/", "pulp/api/v3/docs/api.json")
+
+    serve_pulp(server, pulp_spec(new_versions), new_versions)
+    OpenAPI(server.base_url + "/", "pulp/api/v3/docs/api.json", refresh_cache=True)
+
+    new_hash = hashlib.sha256(json.dumps(pulp_spec(new_versions)).encode()).hexdigest()
+    assert cached_specs(cache_home) == ([new_hash], [new_hash])
+
+
+def test_outdated_spec_is_kept_while_another_server_uses_it(server, cache_home):
+    old_versions, new_versions = {"core": "3.50.0"}, {"core": "3.51.0"}
+    hashes = [
+        hashlib.sha256(json.dumps(pulp_spec(versions)).encode()).hexdigest()
+        for versions in (old_versions, new_versions)
+    ]
+    other_url = server.base_url.replace("127.0.0.1", "localhost") + "/"
+    serve_pulp(server, pulp_spec(old_versions), old_versions)
+    OpenAPI(server.base_url + "/", "pulp/api/v3/docs/api.json")
+    OpenAPI(other_url, "pulp/api/v3/docs/api.json")
+
+    serve_pulp(server, pulp_spec(new_versions), new_versions)
+    OpenAPI(server.base_url + "/", "pulp/api/v3/docs/api.json", refresh_cache=True)
+    assert cached_specs(cache_home) == (sorted(hashes), sorted(hashes))
+
+    OpenAPI(other_url, "pulp/api/v3/docs/api.json", refresh_cache=True)
+    assert cached_specs(cache_home) == ([hashes[1]], [hashes[1]])
+
+
+def test_concurrent_clients_download_the_spec_once(server):
+    versions = {"core": "3.50.0"}
+    serve_pulp(server, pulp_spec(versions), versions)
+    server.holds["/pulp/api/v3/docs/api.json"] = download = threading.Event()
+    clients = []
+
+    def load():
+        clients.append(OpenAPI(server.base_url + "/", "pulp/api/v3/docs/api.json"))
+
+    first = threading.Thread(target=load)
+    first.start()
+    while not downloads(server):
+        time.sleep(0.01)
+    # The first client holds the lock while it downloads, the second one has to wait.
+    second = threading.Thread(target=load)
+    second.start()
+    time.sleep(0.2)
+    assert not clients
+    download.set()
+    first.join()
+    second.join()
+
+    assert downloads(server) == ["/pulp/api/v3/docs/api.json"]
+    assert [sorted(client.operations) for client in clients] == [["status_read", "things_list"]] * 2
+
+
+SWAGGER_SPEC = {
+    "swagger": "2.0",
+    "consumes": ["application/json"],
+    "paths": {
+        "{thing_href}": {
+            "parameters": [{"name": "thing_href", "in": "path", "required": True}],
+            "put": {
+                "operationId": "things_update",
+                "parameters": [
+                    {"name": "data", "in": "body", "required": True},
+                    {"name": "file", "in": "formData", "required": True},
+                    {"name": "X-Task", "in": "header", "required": True},
+                    {"name": "dry_run", "in": "query"},
+                    {"name": "session", "in": "cookie"},
+                    {"name": "X-Task", "in": "query"},
+                ],
+            },
+        }
+    },
+}
+
+
+def extract_params(param_type, path_spec, method_spec, params):
+    # The parameter handling CallPlan.bind replaced, kept as reference.
+    param_spec = {
+        entry["name"]: entry
+        for entry in path_spec.get("parameters", [])
+        if entry["in"] == param_type
+    }
+    param_spec.update(
+        {
+            entry["name"]: entry
+            for entry in method_spec.get("parameters", [])
+            if entry["in"] == param_type
+        }
+    )
+    result = {}
+    for name in list(params.keys()):
+        if name in param_spec:
+            param_spec.pop(name)
+            result[name] = params.pop(name)
+    remaining_required = [
+        item["name"] for item in param_spec.values() if item.get("required", False)
+    ]
+    if any(remaining_required):
+        raise Exception(
+            "Required parameters [{0}] missing for {1}.".format(
+                ", ".join(remaining_required), param_type
+            )
+        )
+    return result
+
+
+def reference_bind(api_spec, operation_id, path, method, parameters):
+    path_spec = api_spec["paths"][path]
+    method_spec = path_spec[method]
+    parameters = parameters.copy()
+    if any(extract_params("cookie", path_spec, method_spec, parameters)):
+        raise NotImplementedError("Cookie parameters are not implemented.")
+    headers = extract_params("header", path_spec, method_spec, parameters)
+    for name, value in extract_params("path", path_spec, method_spec, parameters).items():
+        path = path.replace("{" + name + "}", value)
+    query_string = urlencode(
+        extract_params("query", path_spec, method_spec, parameters), doseq=True
+    )
+    if any(parameters):
+        raise Exception(
+            "Parameter [{names}] not available for {operation_id}.".format(
+                names=", ".join(parameters.keys()), operation_id=operation_id
+            )
+        )
+    return path, headers, query_string
+
+
+def outcome(func, *args):
+    try:
+        return func(*args)
+    except Exception as e:
+        return type(e), str(e)
+
+
+@pytest.mark.parametrize(
+    "parameters",
+    [
+        {"thing_href": "/things/1/", "X-Task": "1"},
+        {"thing_href": "/things/1/", "X-Task": "1", "dry_run": True},
+        {"X-Task": "1"},
+        {"thing_href": "/things/1/"},
+        {},
+        {"thing_href": "/things/1/", "X-Task": "1", "unknown": 1, "other": 2},
+        {"thing_href": "/things/1/", "X-Task": "1", "session": "abc"},
+        {"thing_href": "/things/1/", "X-Task": "1", "data": {}, "file": "x"},
+    ],
+)
+def test_bind_matches_extract_params(parameters):
+    plan = CallPlan("things_update", compile_api(SWAGGER_SPEC)["operations"]["things_update"])
+
+    assert outcome(plan.bind, parameters) == outcome(
+        reference_bind, SWAGGER_SPEC, "things_update", "{thing_href}", "put", parameters
+    )
+
+
+PAGE = {
+    "count": 1234567,
+    "next": None,
+    "résumé": "Größe ✓ 𝄞",
+    "results": [{"name": "Ünïcode ✓ 𝄞", "size": -1.25e3, "ok": True}, 4567890, "x", []],
+    "previous": "/things/?offset=0",
+}
+PAGE_BYTES = json.dumps(PAGE, ensure_ascii=False).encode("utf-8")
+
+
+class CountingDecoder(json.JSONDecoder):
+    calls = 0
+
+    def raw_decode(self, s, idx=0):
+        self.calls += 1
+        return super().raw_decode(s, idx)
+
+
+@pytest.mark.parametrize("chunk_size", range(1, len(PAGE_BYTES) + 1))
+def test_results_stream_chunk_boundaries(chunk_size):
+    # Every chunk size splits a multi-byte character, a number or a key somewhere.
+    stream = ResultsStream(io.BytesIO(PAGE_BYTES), chunk_size=chunk_size)
+
+    assert list(stream) == PAGE["results"]
+    assert stream.has_results
+    assert stream.page == {key: value for key, value in PAGE.items() if key != "results"}
+
+
+@pytest.mark.parametrize("data", [b"", b'{"results": [1, 2', b'{"results": [1} ', b'{"a": "\xc3'])
+def test_results_stream_rejects_broken_json(data):
+    with pytest.raises(ValueError):
+        list(ResultsStream(io.BytesIO(data), chunk_size=3))
+
+
+def test_results_stream_decodes_large_items_a_few_times():
+    item = {"name": "x" * (1024 * 1024)}
+    data = json.dumps({"count": 1, "results": [item]}).encode()
+    stream = ResultsStream(io.BytesIO(data), chunk_size=1024)
+    stream._decoder = CountingDecoder()
+
+    assert list(stream) == [item]
+    # The item spans 1024 chunks, but the buffer doubles between the attempts.
+    assert stream._decoder.calls < 20
+
+
+@pytest.mark.parametrize("size,spilled", [(99, False), (100, False), (101, True)])
+def test_read_response_spills_past_the_threshold(size, spilled):
+    data = b"x" * size
+
+    result = read_response(io.BytesIO(data), spill_threshold=100)
+
+    assert hasattr(result, "read") is spilled
+    assert (result.read() if spilled else result) == data
+
+
+def spilled_page(results, **page):
+    spill = read_response(io.BytesIO(json.dumps(dict(page, results=results)).encode()), 0)
+    return load_spilled(spill)
+
+
+def test_load_spilled_keeps_results_in_the_file():
+    items = [{"index": index} for index in range(5)]
+
+    result = spilled_page(items, count=5, next=None)
+
+    assert isinstance(result["results"], SpilledResults)
+    assert result["count"] == 5 and result["next"] is None
+    assert len(result["results"]) == 5
+    assert list(result["results"]) == list(result["results"]) == items
+    assert result["results"][1] == items[1]
+    assert result["results"][-1] == items[-1]
+    assert result["results"][-5] == items[0]
+    assert result["results"][1:4] == items[1:4]
+    assert result["results"][::-2] == items[::-2]
+    for index in (5, -6):
+        with pytest.raises(IndexError):
+            result["results"][index]
+
+
+def test_load_spilled_decodes_other_responses():
+    data = {"pulp_href": "/things/1/", "names": ["a", "b"], "nested": {"results": 1}}
+
+    assert load_spilled(read_response(io.BytesIO(json.dumps(data).encode()), 0)) == data
+
+
+def test_spilled_responses_are_not_memoized(server):
+    api = serve_things(server, spill_threshold=10)
+
+    for _ in range(2):
+        assert api.call("things_read", {"thing_href": "/things/1/"}) == {"name": "one"}
+        result = api.call("things_list", {"limit": 1})
+        assert list(result["results"]) == [{}]
+
+    assert requested(server) == [("GET", "/things/1/"), ("GET", "/things/?limit=1")] * 2
+    assert api.request_stats["cache_hits"] == 0
+
+
+def joined_multipart(boundary, fields, files):
+    """The multipart body as it was assembled in memory before it was streamed."""
+    part_boundary = b"--" + boundary.encode()
+    form = []
+    for key, value in fields.items():
+        form.extend(
+            [
+                part_boundary,
+                b'Content-Disposition: form-data; name="%s"' % key.encode(),
+                b"",
+                value.encode(),
+            ]
+        )
+    for key, file_data in files.items():
+        form.extend(
+            [
+                part_boundary,
+                b'Content-Disposition: file; name="%s"; filename="%s"'
+                % (key.encode(), key.encode()),
+                b"Content-Type: application/octet-stream",
+                b"",
+                file_data,
+            ]
+        )
+    form.append(part_boundary + b"--")
+    return b"\r\n".join(form)
+
+
+def received(body):
+    """Send body through a socket pair, returning what arrived."""
+    sender, receiver = socket.socketpair()
+    chunks = []
+    reader = threading.Thread(target=lambda: chunks.extend(iter(lambda: receiver.recv(65536), b"")))
+    reader.start()
+    try:
+        body.send(sender)
+    finally:
+        sender.close()
+        reader.join()
+        receiver.close()
+    return b"".join(chunks)
+
+
+@pytest.mark.parametrize("kind", ["file_range", "file", "bytes_io"])
+def test_multipart_body_matches_the_joined_format(tmp_path, kind):
+    content = bytes(range(256)) * 64
+    path = tmp_path / "upload"
+    path.write_bytes(b"head" + content + b"tail")
+    fields = {"sha256": "0123abc", "relative_path": "a/b.txt"}
+
+    with open(str(path), "rb") as f:
+        if kind == "file_range":
+            file_data = FileRange(f, 4, len(content))
+        elif kind == "file":
+            # A plain file object is uploaded from its current position on.
+            f.seek(4)
+            file_data = f
+            content += b"tail"
+        else:
+            file_data = io.BytesIO(content)
+        body = MultipartBody("b0undary")
+        for key, value in fields.items():
+            body.add_field(key, value)
+        body.add_file("file", file_data)
+        body.close()
+
+        expected = joined_multipart("b0undary", fields, {"file": content})
+        assert len(body) == len(expected)
+        assert b"".join(bytes(chunk) for chunk in body) == expected
+        assert received(body) == expected
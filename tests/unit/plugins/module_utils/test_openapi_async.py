@@ -0,0 +1,91 @@
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+from ansible_collections.pulp.squeezer.plugins.module_utils.openapi import OpenAPI
+from ansible_collections.pulp.squeezer.plugins.module_utils.openapi_async import AsyncOpenAPI
+
+SPEC = {
+    "openapi": "3.0.3",
+    "paths": {
+        "/things/": {
+            "get": {
+                "operationId": "things_list",
+                "parameters": [{"name": "name", "in": "query"}],
+            }
+        }
+    },
+}
+
+
+class SlowOpenAPI(OpenAPI):
+    """Answers calls after a short delay, recording how many ran at the same time."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def call(self, operation_id, parameters=None, body=None, uploads=None):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            time.sleep(0.02)
+            if operation_id == "fail":
+                raise ValueError(parameters["index"])
+            return parameters["index"]
+        finally:
+            with self._lock:
+                self.running -= 1
+
+
+def test_call(server):
+    server.routes["/docs/api.json"] = (200, {}, json.dumps(SPEC).encode())
+    server.routes["/things/?name=a"] = (200, {}, b'{"count": 0, "results": []}')
+    openapi = OpenAPI(server.base_url + "/", "docs/api.json")
+
+    async def main():
+        async with AsyncOpenAPI(openapi) as api:
+            return await api.call("things_list", parameters={"name": "a"})
+
+    assert asyncio.run(main()) == {"count": 0, "results": []}
+
+
+def test_wraps_openapi_only():
+    with pytest.raises(TypeError):
+        AsyncOpenAPI(object())
+
+
+def test_gather_keeps_order_and_limits_concurrency():
+    openapi = SlowOpenAPI()
+
+    async def main():
+        async with AsyncOpenAPI(openapi, max_concurrency=3) as api:
+            return await api.gather(
+                *(api.call("things_list", parameters={"index": index}) for index in range(10))
+            )
+
+    assert asyncio.run(main()) == list(range(10))
+    assert openapi.max_running == 3
+
+
+def test_gather_return_exceptions():
+    openapi = SlowOpenAPI()
+
+    async def main(return_exceptions):
+        async with AsyncOpenAPI(openapi) as api:
+            return await api.gather(
+                api.call("things_list", parameters={"index": 0}),
+                api.call("fail", parameters={"index": 1}),
+                api.call("things_list", parameters={"index": 2}),
+                return_exceptions=return_exceptions,
+            )
+
+    results = asyncio.run(main(True))
+    assert results[0] == 0 and results[2] == 2
+    assert isinstance(results[1], ValueError)
+    with pytest.raises(ValueError):
+        asyncio.run(main(False))
@@ -0,0 +1,126 @@
+import json
+
+import pytest
+from ansible.module_utils import basic
+from ansible_collections.pulp.squeezer.plugins.module_utils.openapi import OpenAPI
+from ansible_collections.pulp.squeezer.plugins.module_utils.pulp import (
+    PulpAnsibleModule,
+    PulpEntity,
+    PulpTask,
+    SqueezerException,
+)
+
+SPEC = {
+    "openapi": "3.0.3",
+    "paths": {
+        "/things/": {
+            "get": {
+                "operationId": "things_list",
+                "parameters": [{"name": "limit", "in": "query"}, {"name": "offset", "in": "query"}],
+            },
+        },
+        "{thing_href}": {
+            "parameters": [{"name": "thing_href", "in": "path", "required": True}],
+            "get": {"operationId": "things_read"},
+        },
+        "{task_href}": {
+            "parameters": [{"name": "task_href", "in": "path", "required": True}],
+            "get": {"operationId": "tasks_read"},
+        },
+    },
+}
+
+
+class FakeModule(object):
+    check_mode = False
+
+    def __init__(self, pulp_api):
+        self.pulp_api = pulp_api
+        self.params = {"lookup_projection": False}
+
+
+class PulpThing(PulpEntity):
+    _href = "thing_href"
+    _list_id = "things_list"
+    _read_id = "things_read"
+
+
+def serve(server):
+    server.routes["/docs/api.json"] = (200, {}, json.dumps(SPEC).encode())
+    module = FakeModule(OpenAPI(server.base_url + "/", "docs/api.json"))
+    del server.requests[:]
+    return module
+
+
+def requested(server):
+    return [request[1] for request in server.requests]
+
+
+def test_list_does_not_memoize_pages(server):
+    module = serve(server)
+    for offset in (0, 20, 40):
+        page = {
+            "count": 45,
+            "next": "/things/?limit=20&offset={0}".format(offset + 20) if offset < 40 else None,
+            "results": [{"index": index} for index in range(offset, min(offset + 20, 45))],
+        }
+        server.routes["/things/?limit=20&offset={0}".format(offset)] = (
+            200,
+            {},
+            json.dumps(page).encode(),
+        )
+
+    for _ in range(2):
+        entities = list(PulpThing(module).list())
+        assert [entity["index"] for entity in entities] == list(range(45))
+
+    assert len(server.requests) == 6
+    assert module.pulp_api.request_stats["cache_hits"] == 0
+
+
+def test_task_wait_for_clears_the_cache(server):
+    module = serve(server)
+    server.routes["/things/1/"] = (200, {}, b'{"pulp_href": "/things/1/"}')
+    server.routes["/tasks/1/"] = (200, {}, b'{"pulp_href": "/tasks/1/", "state": "completed"}')
+    module.pulp_api.call("things_read", {"thing_href": "/things/1/"})
+
+    PulpTask(module, {"pulp_href": "/tasks/1/"}).wait_for()
+    module.pulp_api.call("things_read", {"thing_href": "/things/1/"})
+
+    assert requested(server) == ["/things/1/", "/tasks/1/", "/things/1/"]
+
+
+def run_module(monkeypatch, capsys, server, body):
+    """Run body within a legacy module against the stub server, returning the module result."""
+    args = {
+        "pulp_url": server.base_url,
+        "username": "admin",
+        "password": "secret",
+        "squeezer_stats": True,
+    }
+    monkeypatch.setattr(basic, "_ANSIBLE_ARGS", json.dumps({"ANSIBLE_MODULE_ARGS": args}).encode())
+    server.routes["/pulp/api/v3/docs/api.json"] = (200, {}, json.dumps(SPEC).encode())
+    with pytest.raises(SystemExit):
+        with PulpAnsibleModule() as module:
+            body(module)
+    return json.loads(capsys.readouterr().out)
+
+
+@pytest.mark.parametrize("failure", [None, SqueezerException("Nope."), ValueError("Oops.")])
+def test_stats_are_reported_on_failure(monkeypatch, capsys, server, failure):
+    thing = b'{"pulp_href": "/things/1/"}'
+    server.routes["/things/1/"] = (200, {}, thing)
+
+    def body(module):
+        module.pulp_api.call("things_read", {"thing_href": "/things/1/"})
+        if failure is not None:
+            raise failure
+
+    result = run_module(monkeypatch, capsys, server, body)
+
+    assert result.get("failed", False) is (failure is not None)
+    stats = result["squeezer_stats"]
+    assert stats["requests"] == 1
+    assert stats["operations"]["things_read"]["count"] == 1
+    assert stats["bytes_received"] == len(thing)
+    assert stats["request_stats"]["requests"] == 1
@@ -0,0 +1,40 @@
+import json
+
+import pytest
+from ansible.module_utils import basic
+from ansible_collections.pulp.squeezer.plugins.module_utils.pulp_glue import (
+    PulpAnsibleModule,
+    SqueezerException,
+)
+
+ARGS = {"pulp_url": "http://localhost", "username": "admin", "password": "secret"}
+
+
+def set_module_args(monkeypatch, **args):
+    args = dict(ARGS, **args)
+    monkeypatch.setattr(basic, "_ANSIBLE_ARGS", json.dumps({"ANSIBLE_MODULE_ARGS": args}).encode())
+
+
+@pytest.mark.parametrize("failure", [None, SqueezerException("Nope."), ValueError("Oops.")])
+def test_stats_are_reported_on_failure(monkeypatch, capsys, failure):
+    set_module_args(monkeypatch, squeezer_stats=True)
+
+    with pytest.raises(SystemExit):
+        with PulpAnsibleModule() as module:
+            module.pulp_ctx.hooks.fire("task_wait", 1.5)
+            if failure is not None:
+                raise failure
+    result = json.loads(capsys.readouterr().out)
+
+    assert result.get("failed", False) is (failure is not None)
+    assert result["squeezer_stats"]["task_wait_time"] == 1.5
+
+
+def test_projection_needs_the_module_option(monkeypatch):
+    set_module_args(monkeypatch)
+    assert PulpAnsibleModule().projection("sha256") == {}
+
+    set_module_args(monkeypatch, lookup_projection=True)
+    argument_spec = {"lookup_projection": {"type": "bool", "default": False}}
+    module = PulpAnsibleModule(argument_spec=argument_spec)
+    assert module.projection("sha256") == {"fields": "pulp_href,sha256"}